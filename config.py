@@ -1,3 +1,13 @@
+"""
+Game Configuration - All Tunable Constants
+
+Modules copy the values they read every frame into private module
+constants (_NAME = config.NAME) at import, so hot loops skip the
+attribute lookup. Those copies are taken once: edits to such values
+need a restart. Values that change during a run (TRACK_SCROLL_SPEED,
+reset by DifficultyManager) are always read through config instead.
+"""
+
 from ursina import color
 
 # ----------------------------------------------------------------------------
@@ -34,6 +44,7 @@ TEXTURE_WALL = 'assets/wall_texture.png'
 TEXTURE_WOOD = 'assets/wood_texture.png'
 TEXTURE_METAL = 'assets/metal_texture.png'
 TEXTURE_ORB = 'assets/orb_texture.png'
+TEXTURE_GRID = 'assets/grid_texture.png'  # Tiled grid line overlay
 
 # ----------------------------------------------------------------------------
 # GAME SETTINGS
@@ -48,6 +59,7 @@ GRID_ANIMATION_SPEED = 0.5         # Multiplier for visual scroll effect
 LANE_POSITIONS = [-2.0, 0.0, 2.0]  # x-coordinates for Left, Center, Right
 LANE_COUNT = 3
 LANE_SWITCH_SPEED = 12.0           # Visual lerp speed
+LANE_SNAP_EPSILON = 0.001          # Snap to lane X once this close (ends the lerp)
 LANE_SPEED = 10.0                  # (Deprecated/Unused? Keeping for safety based on previous file)
 
 # Player Settings
@@ -64,6 +76,7 @@ JUMP_HEIGHT = 2.5                  # Peak height of jump
 JUMP_DURATION = 0.5                # Seconds to complete jump
 SLIDE_DURATION = 0.8               # Seconds to remain sliding
 SLIDE_HEIGHT_SCALE = 0.4           # Scale factor for height when sliding
+PLAYER_VERTICAL_STATES = ('grounded', 'jumping', 'sliding')  # Index order = vertical_state_idx
 
 # Collectible Settings
 COLLECTIBLE_SIZE = 0.5             # Scale for orbs/shields
@@ -72,20 +85,27 @@ SHIELD_DURATION = 5.0              # Seconds of invincibility
 SCORE_PER_UNIT = 10                # Points per unit traveled
 SCORE_PER_SECOND = 10              # Points per second survived
 SCORE_ORB = 100                    # Points per orb collected
+HIGH_SCORE_FLUSH_INTERVAL = 5.0    # Min seconds between high score file writes
 
 # Obstacle Settings
 OBS_LOW_SIZE = (1.0, 0.6, 1.0)     # Width, Height, Depth
 OBS_LOW_HEIGHT = 0.3               # Center Y (0.6 / 2)
+OBS_LOW_TEX_SCALE = (1, 1)         # Texture tiling (U, V)
 OBS_HIGH_SIZE = (1.0, 2.5, 1.0)
 OBS_HIGH_HEIGHT = 1.25             # Center Y (2.5 / 2)
+OBS_HIGH_TEX_SCALE = (1, 2)        # Tall wall: tile texture twice vertically
 OBS_MOVING_SIZE = (1.0, 1.2, 1.0)
 OBS_MOVING_HEIGHT = 0.6            # Center Y (1.2 / 2)
+OBS_MOVING_TEX_SCALE = (1, 1)
 OBS_MOVING_SPEED = 5.0             # Lateral speed
 OBSTACLE_DESPAWN_DISTANCE = -10.0  # Z position to remove obstacle
 OBSTACLE_SPAWN_DISTANCE = 60.0     # Z position to spawn obstacle
 SPAWN_INTERVAL_MIN = 0.8           # Minimum seconds between spawns
 SPAWN_INTERVAL_MAX = 1.5           # Maximum seconds between spawns
 OBSTACLE_COLLISION_THRESHOLD = 1.5 # Distance to trigger collision
+OBSTACLE_TYPES = ('low', 'high', 'moving')
+COLLECTIBLE_TYPES = ('orb', 'shield')
+POOL_PREFILL_PER_TYPE = 4          # Entities built per type at startup (pool warm-up)
 
 # Camera Settings
 CAMERA_POSITION = (0, 6, -14)      # Lower and further back
@@ -95,8 +115,7 @@ CAMERA_FOLLOW_SPEED = 0.1          # Smooth follow factor
 COLOR_UI_TEXT = color.white
 
 # HUD Settings
-UI_SCORE_POSITION = (-0.85, 0.45)  # Top-left
-UI_DISTANCE_POSITION = (0.65, 0.45)# Top-right
+UI_STATS_POSITION = (-0.85, 0.45)  # Top-left (score and distance, one line each)
 UI_SHIELD_POSITION = (0, 0.35)     # Top-center
 UI_GAME_OVER_POSITION = (0, 0)     # Center
 UI_FONT_SIZE = 1.5
@@ -113,8 +132,11 @@ SHAKE_INTENSITY_COLLISION = 0.5    # Reduced from 1.0
 SHAKE_DURATION_COLLISION = 0.4
 SHAKE_INTENSITY_SHIELD = 0.3       # Reduced from 0.5
 SHAKE_DURATION_SHIELD = 0.2
+PARTICLE_POOL_SIZE = 64            # Reusable particle cubes (ring buffer)
+PARTICLE_LIFETIME = 0.5            # Seconds a particle flies before hiding
 CAMERA_TILT_ANGLE = 2.0            # Reduced from 5.0 (subtle tilt)
 CAMERA_TILT_SPEED = 3.0            # Slower tilt
+CAMERA_SETTLE_EPSILON = 0.001      # Camera snaps to rest once this close (stops updating)
 
 # Menu Settings
 UI_MENU_TITLE_POS = (0, 0.2)
@@ -125,6 +147,11 @@ COLOR_MENU_TEXT = color.white
 
 # Debug
 DEBUG_MODE = False
+LOG_BUFFER_SIZE = 256              # Buffered debug log lines between flushes
+LOG_FLUSH_INTERVAL = 1.0           # Seconds between debug log flushes
+DEBUG_TEXT_FRAME_MASK = 3          # Debug overlay refreshes when frame & mask == 0 (every 4th)
+PROFILE = False                    # Time each game loop section (F3 prints a report)
+PROFILE_REPORT_FRAMES = 60         # Frames between automatic profile reports
 
 # ====================================
 # PHASE 5 FIXES: MAGIC NUMBERS
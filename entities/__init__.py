@@ -7,5 +7,6 @@ from entities.player import Player
 from entities.track import Track
 from entities.obstacle import Obstacle
 from entities.collectible import Collectible
+from entities.pool import ObstaclePool, CollectiblePool
 
-__all__ = ['Player', 'Track', 'Obstacle', 'Collectible']
+__all__ = ['Player', 'Track', 'Obstacle', 'Collectible', 'ObstaclePool', 'CollectiblePool']
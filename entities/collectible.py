@@ -3,12 +3,13 @@ Collectible Entity - Arcade Logic Rewards
 
 Collectibles are simple spheres that:
 1. Stay in their assigned lane
-2. Move toward the player (decreasing Z)
+2. Move toward the player (decreasing Z, driven by ScrollSystem)
 3. Get collected on proximity
 """
 
 from ursina import *
 import config
+from utils.log import dlog
 
 class Collectible(Entity):
     """
@@ -48,31 +49,64 @@ class Collectible(Entity):
             texture=texture,
             scale=config.COLLECTIBLE_SIZE,
             position=(x_pos, config.COLLECTIBLE_HEIGHT, z_position),
-            collider='box'
+            collider=None  # Pickup is lane + distance math (CollisionDetector)
         )
         
         # Store state
-        self.lane = lane
-        self.z_position = z_position
         self.item_type = item_type
+        self.pool = None  # Set by spawn() when the collectible is pooled
+        self._configure(lane, z_position)
         
-        print(f"[COLLECTIBLE] Created {item_type} at lane {lane}, z={z_position}")
+        if config.DEBUG_MODE:
+            dlog(f"[COLLECTIBLE] Created {item_type} at lane {lane}, z={z_position}")
     
-    def update(self):
+    @classmethod
+    def spawn(cls, pool, lane, z_position, item_type):
         """
-        Update collectible position.
-        Scrolls toward player.
+        Get a collectible from the pool, or build a new one if none is free.
+        
+        Args:
+            pool (CollectiblePool): Pool to recycle from (and return to on cleanup)
+            lane (int): Lane index (0, 1, or 2)
+            z_position (float): Starting Z coordinate
+            item_type (str): 'orb' or 'shield'
+        
+        Returns:
+            Collectible: An enabled collectible placed at the requested position
         """
-        # Scroll toward player
-        self.z_position -= config.TRACK_SCROLL_SPEED * time.dt
-        self.z = self.z_position
+        item = pool.acquire(item_type)
+        if item is None:
+            item = cls(lane, z_position, item_type)
+            item.pool = pool
+        else:
+            item._configure(lane, z_position)
+            item.enabled = True
+        return item
+    
+    def _configure(self, lane, z_position):
+        """
+        Place the collectible and reset per-spawn state.
         
-        # Auto-cleanup if behind player
-        if self.z_position < config.OBSTACLE_DESPAWN_DISTANCE:
-            self.cleanup()
+        Args:
+            lane (int): Lane index (0, 1, or 2)
+            z_position (float): Starting Z coordinate
+        """
+        self.lane = lane
+        self.x = config.LANE_POSITIONS[lane]
+        self.z = z_position
     
     def cleanup(self):
         """
         Remove this item from the game.
+        Pooled items are disabled and returned to their pool;
+        standalone ones are destroyed.
         """
-        destroy(self)
+        if not self.enabled:
+            return  # Already recycled
+        
+        if self.pool is None:
+            destroy(self)
+            return
+        
+        self.enabled = False
+        self.pool.release(self.item_type, self)
@@ -4,6 +4,39 @@ Geometry generation for Ursina.
 
 from ursina import Mesh, Vec3
 
+# Triangle vertex lists keyed by size. The vertices are constant per size,
+# so they are built once and shared by every mesh generated afterwards.
+# (The Mesh itself is not shared: assigning one NodePath to a second
+# entity would reparent it away from the first.)
+_OCTAHEDRON_VERTEX_CACHE = {}
+
+# Unit octahedron: six vertices aligned to the axes (Y up, Z forward)
+# 0: Top, 1: Bottom, 2: Right, 3: Left, 4: Front, 5: Back
+_UNIT_VERTICES = (
+    (0, 1, 0),
+    (0, -1, 0),
+    (1, 0, 0),
+    (-1, 0, 0),
+    (0, 0, 1),
+    (0, 0, -1),
+)
+
+# 8 triangular faces as indices into _UNIT_VERTICES
+# Order matters for normals (counter-clockwise usually visible)
+_FACE_INDICES = (
+    # Upper hemisphere
+    0, 4, 2,  # Top-Front-Right
+    0, 2, 5,  # Top-Right-Back
+    0, 5, 3,  # Top-Back-Left
+    0, 3, 4,  # Top-Left-Front
+    
+    # Lower hemisphere
+    1, 2, 4,  # Bottom-Right-Front
+    1, 5, 2,  # Bottom-Back-Right
+    1, 3, 5,  # Bottom-Left-Back
+    1, 4, 3,  # Bottom-Front-Left
+)
+
 def generate_octahedron_mesh(size=1.0):
     """
     Generate an Ursina Mesh for a regular octahedron.
@@ -14,51 +47,26 @@ def generate_octahedron_mesh(size=1.0):
     Returns:
         Mesh: Ursina mesh object
     """
-    # Six vertices aligned to axes
-    # Ursina uses Vec3
-    top    = Vec3(0, size, 0)
-    bottom = Vec3(0, -size, 0)
-    right  = Vec3(size, 0, 0)
-    left   = Vec3(-size, 0, 0)
-    front  = Vec3(0, 0, -size) # Ursina Z forward is positive? Actually Ursina is usually +Z forward or back depending on cam.
-                               # Let's assume standard right-hand rule or just symmetric.
-    back   = Vec3(0, 0, size)
-
-    # In Ursina/Panda3D default: X right, Y up, Z forward (into screen)
-    # Check current player coordinate: 
-    # Player moves in Z (forward). 
-    # Ground is X/Z plane? No, ursina default is Y up.
-    # Track is width(X), length(Z).
-    
-    # Vertices (6)
-    # 0: Top, 1: Bottom, 2: Right, 3: Left, 4: Front, 5: Back
-    v0 = Vec3(0, size, 0)
-    v1 = Vec3(0, -size, 0)
-    v2 = Vec3(size, 0, 0)
-    v3 = Vec3(-size, 0, 0)
-    v4 = Vec3(0, 0, size)
-    v5 = Vec3(0, 0, -size)
-    
-    # 8 triangular faces
-    # Each face is a list of 3 vertices
-    # Order matters for normals (counter-clockwise usually visible)
-    
-    verts = [
-        # Upper hemisphere
-        v0, v4, v2, # Top-Front-Right
-        v0, v2, v5, # Top-Right-Back
-        v0, v5, v3, # Top-Back-Left
-        v0, v3, v4, # Top-Left-Front
-        
-        # Lower hemisphere
-        v1, v2, v4, # Bottom-Right-Front
-        v1, v5, v2, # Bottom-Back-Right
-        v1, v3, v5, # Bottom-Left-Back
-        v1, v4, v3, # Bottom-Front-Left
-    ]
+    verts = _OCTAHEDRON_VERTEX_CACHE.get(size)
+    if verts is None:
+        verts = _build_octahedron_vertices(size)
+        _OCTAHEDRON_VERTEX_CACHE[size] = verts
     
     # Create simple flat colors (cyan-ish)
     # For a flat shaded look, we don't strictly need normals if we use unlit shader, 
     # but let's provide basic structure.
     
-    return Mesh(vertices=verts, static=True) 
+    return Mesh(vertices=list(verts), static=True) 
+
+def _build_octahedron_vertices(size):
+    """
+    Build the triangle vertex list for an octahedron.
+    
+    Args:
+        size: Distance from center to vertex
+        
+    Returns:
+        tuple: 24 Vec3 vertices (8 faces x 3)
+    """
+    verts = [Vec3(x * size, y * size, z * size) for x, y, z in _UNIT_VERTICES]
+    return tuple(verts[i] for i in _FACE_INDICES)
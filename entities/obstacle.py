@@ -3,12 +3,29 @@ Obstacle Entity - Arcade Logic Hazards
 
 Obstacles are simple cubes that:
 1. Stay in their assigned lane
-2. Move toward the player (decreasing Z)
-3. Get destroyed when behind player
+2. Move toward the player (decreasing Z, driven by ScrollSystem)
+3. Get recycled when behind player
 """
 
 from ursina import *
 import config
+from utils.log import dlog
+
+_LANE_POSITIONS = tuple(config.LANE_POSITIONS)
+_LANE_LEFT_X = _LANE_POSITIONS[0]   # Edge lane X bounds for moving obstacles
+_LANE_RIGHT_X = _LANE_POSITIONS[2]
+_INV_LANE_STEP = 1.0 / (_LANE_POSITIONS[1] - _LANE_POSITIONS[0])  # Lanes are evenly spaced
+_MOVING_SPEED = config.OBS_MOVING_SPEED
+
+# Transparent glow versions of each obstacle color, built once at import
+_GLOW_COLORS = {
+    obs_type: color.rgba(base.r, base.g, base.b, 100)
+    for obs_type, base in (
+        ('low', config.COLOR_OBS_LOW),
+        ('high', config.COLOR_OBS_HIGH),
+        ('moving', config.COLOR_OBS_MOVING),
+    )
+}
 
 class Obstacle(Entity):
     """
@@ -36,7 +53,7 @@ class Obstacle(Entity):
             y_pos = config.OBS_LOW_HEIGHT
             obs_color = config.COLOR_OBS_LOW
             texture = config.TEXTURE_WOOD
-            texture_scale = (1, 1)
+            texture_scale = config.OBS_LOW_TEX_SCALE
             
         elif obs_type == 'high':
             model = 'cube'
@@ -44,7 +61,7 @@ class Obstacle(Entity):
             y_pos = config.OBS_HIGH_HEIGHT
             obs_color = config.COLOR_OBS_HIGH
             texture = config.TEXTURE_WALL
-            texture_scale = (1, 2)
+            texture_scale = config.OBS_HIGH_TEX_SCALE
             
         elif obs_type == 'moving':
             model = 'cube'
@@ -52,9 +69,7 @@ class Obstacle(Entity):
             y_pos = config.OBS_MOVING_HEIGHT
             obs_color = config.COLOR_OBS_MOVING
             texture = config.TEXTURE_METAL
-            texture_scale = (1, 1)
-            self.move_speed = config.OBS_MOVING_SPEED
-            self.direction = 1 if random.random() > 0.5 else -1
+            texture_scale = config.OBS_MOVING_TEX_SCALE
         else:
             raise ValueError(f"Invalid obstacle type: {obs_type}")
         
@@ -69,7 +84,7 @@ class Obstacle(Entity):
             texture=texture,
             texture_scale=texture_scale,
             position=(x_pos, y_pos, z_position),
-            collider='box'
+            collider=None  # Collision is lane + distance math (CollisionDetector)
         )
 
         # Glow Effect (Child Entity)
@@ -77,7 +92,7 @@ class Obstacle(Entity):
         self.glow = Entity(
             parent=self,
             model=model,
-            color=color.rgba(obs_color.r, obs_color.g, obs_color.b, 100), # Transparent version of base color
+            color=_GLOW_COLORS[obs_type], # Transparent version of base color
             scale=1.2, # Slightly larger
             texture=None,
             unlit=True, # Glow appearance
@@ -87,57 +102,96 @@ class Obstacle(Entity):
 
         
         # Store state
-        self.lane = lane
-        self.z_position = z_position
         self.obs_type = obs_type
+        self.obs_type_idx = config.OBSTACLE_TYPES.index(obs_type)  # For table lookups
+        self.pool = None  # Set by spawn() when the obstacle is pooled
         
-        # Moving obstacle specific
-        self.move_direction = 1 if lane == 0 else -1  # Start moving away from edge
+        # Per-frame behavior, chosen once (pooled obstacles never change type).
+        # None means the obstacle only scrolls.
+        self.tick = self.update_moving_obstacle if obs_type == 'moving' else None
+        self._configure(lane, z_position)
         
-        print(f"[OBSTACLE] Created {obs_type} at lane {lane}, z={z_position}")
+        if config.DEBUG_MODE:
+            dlog(f"[OBSTACLE] Created {obs_type} at lane {lane}, z={z_position}")
     
-    def update(self):
+    @classmethod
+    def spawn(cls, pool, lane, z_position, obs_type):
         """
-        Update obstacle position.
-        Scrolls toward player and handles special behaviors.
+        Get an obstacle from the pool, or build a new one if none is free.
+        
+        Args:
+            pool (ObstaclePool): Pool to recycle from (and return to on cleanup)
+            lane (int): Lane index (0, 1, or 2)
+            z_position (float): Starting Z coordinate
+            obs_type (str): 'low', 'high', or 'moving'
+        
+        Returns:
+            Obstacle: An enabled obstacle placed at the requested position
+        """
+        obs = pool.acquire(obs_type)
+        if obs is None:
+            obs = cls(lane, z_position, obs_type)
+            obs.pool = pool
+        else:
+            obs._configure(lane, z_position)
+            obs.enabled = True
+        return obs
+    
+    def _configure(self, lane, z_position):
         """
-        # Scroll toward player
-        self.z_position -= config.TRACK_SCROLL_SPEED * time.dt
-        self.z = self.z_position
+        Place the obstacle and reset per-spawn state.
+        Type-specific visuals are set once in __init__ and never change.
         
-        # Moving obstacle behavior
-        if self.obs_type == 'moving':
-            self.update_moving_obstacle()
+        Args:
+            lane (int): Lane index (0, 1, or 2)
+            z_position (float): Starting Z coordinate
+        """
+        self.lane = lane
+        self.x = _LANE_POSITIONS[lane]
+        self.z = z_position
         
-        # Auto-cleanup if behind player
-        if self.z_position < config.OBSTACLE_DESPAWN_DISTANCE:
-            self.cleanup()
+        # Moving obstacle specific
+        self.move_direction = 1 if lane == 0 else -1  # Start moving away from edge
     
-    def update_moving_obstacle(self):
+    def update_moving_obstacle(self, dt):
         """
         Special behavior for moving obstacles.
         Shifts between lanes over time.
+        
+        Args:
+            dt (float): Frame delta time in seconds
         """
-        # Move laterally
-        self.x += self.move_direction * config.OBS_MOVING_SPEED * time.dt
+        # Move laterally (work on a local, write the entity once)
+        x = self.x + self.move_direction * _MOVING_SPEED * dt
         
         # Check lane boundaries and reverse
-        if self.x <= config.LANE_POSITIONS[0]:
-            self.x = config.LANE_POSITIONS[0]
+        if x <= _LANE_LEFT_X:
+            x = _LANE_LEFT_X
             self.move_direction = 1
             self.lane = 0
-        elif self.x >= config.LANE_POSITIONS[2]:
-            self.x = config.LANE_POSITIONS[2]
+        elif x >= _LANE_RIGHT_X:
+            x = _LANE_RIGHT_X
             self.move_direction = -1
             self.lane = 2
         else:
-            # Determine current lane
-            distances = [abs(self.x - pos) for pos in config.LANE_POSITIONS]
-            self.lane = distances.index(min(distances))
+            # Nearest lane: lanes are evenly spaced, so round the offset from the
+            # left edge in lane steps (strictly inside the edges, so no clamp needed)
+            self.lane = int(round((x - _LANE_LEFT_X) * _INV_LANE_STEP))
+        
+        self.x = x
     
     def cleanup(self):
         """
         Remove this obstacle from the game.
+        Pooled obstacles are disabled and returned to their pool;
+        standalone ones are destroyed.
         """
-        print(f"[OBSTACLE] Destroyed {self.obs_type} at z={self.z_position:.1f}")
-        destroy(self)
+        if not self.enabled:
+            return  # Already recycled
+        
+        if self.pool is None:
+            destroy(self)
+            return
+        
+        self.enabled = False
+        self.pool.release(self.obs_type, self)
@@ -7,8 +7,22 @@ Visual position smoothly lerps between lanes, but game logic uses discrete lane
 
 from ursina import *
 import config
+from utils.log import dlog
 from entities.geometry import generate_octahedron_mesh
 
+_LANE_SWITCH_SPEED = config.LANE_SWITCH_SPEED
+_LANE_SNAP_EPSILON = config.LANE_SNAP_EPSILON
+
+# Jump curve
+_INV_JUMP_DURATION = 1.0 / config.JUMP_DURATION  # Progress per second
+_JUMP_PEAK_SCALE = 4.0 * config.JUMP_HEIGHT      # 4*t*(1-t) peaks at 1.0 when t=0.5
+_JUMP_BASE_Y = config.PLAYER_START_Y
+
+# Vertical state name -> small int, for table lookups (see CollisionDetector)
+_VERTICAL_STATE_INDEX = {
+    state: idx for idx, state in enumerate(config.PLAYER_VERTICAL_STATES)
+}
+
 class Player(Entity):
     """
     Player entity with arcade-style lane switching.
@@ -40,7 +54,7 @@ class Player(Entity):
         self.target_x = config.LANE_POSITIONS[self.lane]
         
         # Vertical State Machine
-        self.vertical_state = 'grounded'  # grounded, jumping, sliding
+        self.set_vertical_state('grounded')  # grounded, jumping, sliding
         
         # Jump state
         self.jump_progress = 0.0
@@ -64,6 +78,16 @@ class Player(Entity):
         
         print(f"[PLAYER] Initialized at lane {self.lane}")
     
+    def set_vertical_state(self, state):
+        """
+        Change vertical state, keeping its integer index in step.
+        
+        Args:
+            state (str): 'grounded', 'jumping', or 'sliding'
+        """
+        self.vertical_state = state
+        self.vertical_state_idx = _VERTICAL_STATE_INDEX[state]
+    
     def switch_lane(self, direction):
         """
         Attempt to switch lanes.
@@ -75,14 +99,16 @@ class Player(Entity):
         
         # Check boundaries
         if new_lane < 0 or new_lane >= config.LANE_COUNT:
-            print(f"[PLAYER] Cannot move to lane {new_lane} (out of bounds)")
+            if config.DEBUG_MODE:
+                dlog(f"[PLAYER] Cannot move to lane {new_lane} (out of bounds)")
             return
         
         # Valid move
         self.lane = new_lane
         self.target_x = config.LANE_POSITIONS[self.lane]
         
-        print(f"[PLAYER] Switched to lane {self.lane}")
+        if config.DEBUG_MODE:
+            dlog(f"[PLAYER] Switched to lane {self.lane}")
 
     def jump(self):
         """
@@ -92,10 +118,11 @@ class Player(Entity):
         if self.vertical_state != 'grounded':
             return  # Cannot jump while already jumping/sliding
         
-        self.vertical_state = 'jumping'
+        self.set_vertical_state('jumping')
         self.jump_progress = 0.0
         
-        print("[PLAYER] Jump started")
+        if config.DEBUG_MODE:
+            dlog("[PLAYER] Jump started")
     
     def slide(self):
         """
@@ -105,7 +132,7 @@ class Player(Entity):
         if self.vertical_state != 'grounded':
             return  # Cannot slide while jumping
         
-        self.vertical_state = 'sliding'
+        self.set_vertical_state('sliding')
         self.slide_timer = config.SLIDE_DURATION
         
         # Shrink height
@@ -115,43 +142,58 @@ class Player(Entity):
         # Player's Y is at their center, so we need to adjust
         self.y = self.slide_scale_y / 2.0
         
-        print("[PLAYER] Slide started")
+        if config.DEBUG_MODE:
+            dlog("[PLAYER] Slide started")
     
     def stand_up(self):
         """
         Return to normal standing state from slide.
         """
-        self.vertical_state = 'grounded'
+        self.set_vertical_state('grounded')
         self.scale_y = self.normal_scale_y
         self.y = config.PLAYER_START_Y
         
-        print("[PLAYER] Stood up")
+        if config.DEBUG_MODE:
+            dlog("[PLAYER] Stood up")
     
     def update(self):
         """
         Called every frame by Ursina.
         Updates all movement.
         """
+        dt = time.dt  # Read once, shared by every step below
+        
         # 1. Lane Movement (Horizontal)
-        self.x = lerp(self.x, self.target_x, time.dt * config.LANE_SWITCH_SPEED)
+        # Plain float lerp (Ursina's generic lerp type-checks every call),
+        # clamped so a long frame can't overshoot, and snapped once settled
+        x = self.x
+        dx = self.target_x - x
+        if dx:
+            if abs(dx) < _LANE_SNAP_EPSILON:
+                self.x = self.target_x
+            else:
+                self.x = x + dx * min(dt * _LANE_SWITCH_SPEED, 1.0)
         
         # 2. Vertical Movement (State-based)
         if self.vertical_state == 'jumping':
-            self.update_jump()
+            self.update_jump(dt)
         elif self.vertical_state == 'sliding':
-            self.update_slide()
+            self.update_slide(dt)
             
         # 3. Visual Rotation
-        self.rotation += self.rotation_speed * time.dt
+        self.rotation += self.rotation_speed * dt
         
         # 4. Trail
-        self.update_trail()
+        self.update_trail(dt)
         
-    def update_trail(self):
+    def update_trail(self, dt):
         """
         Spawn trail particles.
+        
+        Args:
+            dt (float): Frame delta time in seconds
         """
-        self.trail_timer -= time.dt
+        self.trail_timer -= dt
         if self.trail_timer <= 0:
             self.trail_timer = self.trail_interval
             
@@ -168,37 +210,41 @@ class Player(Entity):
             particle.animate_color(color.clear, duration=0.5, curve=curve.linear)
             destroy(particle, delay=0.5)
 
-    def update_jump(self):
+    def update_jump(self, dt):
         """
         Update jump animation using parabolic curve.
+        
+        Args:
+            dt (float): Frame delta time in seconds
         """
         # Increment progress
-        self.jump_progress += time.dt / config.JUMP_DURATION
+        t = self.jump_progress + dt * _INV_JUMP_DURATION
         
         # Check if jump complete
-        if self.jump_progress >= 1.0:
+        if t >= 1.0:
             # Land
-            self.vertical_state = 'grounded'
+            self.set_vertical_state('grounded')
             self.jump_progress = 0.0
-            self.y = config.PLAYER_START_Y
+            self.y = _JUMP_BASE_Y
             
-            print("[PLAYER] Landed")
+            if config.DEBUG_MODE:
+                dlog("[PLAYER] Landed")
             return
         
-        # Calculate height using parabolic curve
-        t = self.jump_progress
-        curve_value = 4 * t * (1 - t)
-        height = curve_value * config.JUMP_HEIGHT
+        self.jump_progress = t
         
-        # Apply height
-        self.y = config.PLAYER_START_Y + height
+        # Apply height using parabolic curve: 4 * t * (1 - t) * JUMP_HEIGHT
+        self.y = _JUMP_BASE_Y + _JUMP_PEAK_SCALE * t * (1.0 - t)
     
-    def update_slide(self):
+    def update_slide(self, dt):
         """
         Update slide state.
         Countdown timer, then stand back up.
+        
+        Args:
+            dt (float): Frame delta time in seconds
         """
-        self.slide_timer -= time.dt
+        self.slide_timer -= dt
         
         if self.slide_timer <= 0.0:
             # Slide complete, stand up
@@ -213,10 +259,11 @@ class Player(Entity):
         self.x = self.target_x
         self.y = config.PLAYER_START_Y
         self.z = config.PLAYER_START_Z
-        self.vertical_state = 'grounded'
+        self.set_vertical_state('grounded')
         self.jump_progress = 0.0
         self.slide_timer = 0.0
         self.scale_y = self.normal_scale_y
         self.z_position = config.PLAYER_START_Z
-        print("[PLAYER] Reset")
+        if config.DEBUG_MODE:
+            dlog("[PLAYER] Reset")
 
@@ -0,0 +1,65 @@
+"""
+Entity Pools - Recycling for Scrolling Entities
+
+Obstacles and collectibles are spawned and despawned constantly.
+Building an Ursina Entity (model, texture, glow child) is expensive,
+so despawned entities are disabled and parked in a free list keyed by
+type, then handed back out by the next spawn of the same type.
+"""
+
+import config
+
+class EntityPool:
+    """
+    Free lists of disabled entities, one list per entity type.
+    """
+
+    def __init__(self, entity_types):
+        """
+        Create an empty pool.
+
+        Args:
+            entity_types (tuple): Type names this pool accepts
+        """
+        self.free = {entity_type: [] for entity_type in entity_types}
+
+    def acquire(self, entity_type):
+        """
+        Take a recycled entity of the given type.
+
+        Args:
+            entity_type (str): Type name to look up
+
+        Returns:
+            Entity or None: A disabled entity, or None if the pool is empty
+        """
+        free = self.free[entity_type]
+        if free:
+            return free.pop()
+        return None
+
+    def release(self, entity_type, entity):
+        """
+        Park a disabled entity for later reuse.
+
+        Args:
+            entity_type (str): Type name of the entity
+            entity: The entity being recycled
+        """
+        self.free[entity_type].append(entity)
+
+class ObstaclePool(EntityPool):
+    """
+    Pool of Obstacle entities keyed by obs_type.
+    """
+
+    def __init__(self):
+        super().__init__(config.OBSTACLE_TYPES)
+
+class CollectiblePool(EntityPool):
+    """
+    Pool of Collectible entities keyed by item_type.
+    """
+
+    def __init__(self):
+        super().__init__(config.COLLECTIBLE_TYPES)
@@ -8,6 +8,9 @@ The player stays at Z=0, and the texture offset updates to create movement illus
 from ursina import *
 import config
 
+_TRACK_SCROLL_RATE = config.GRID_ANIMATION_SPEED  # Track texture scroll multiplier
+_GRID_SCROLL_RATE = 1.0 / config.GRID_SPACING      # Grid tiles per world unit
+
 class Track(Entity):
     """
     Infinite scrolling track with grid lines.
@@ -36,35 +39,34 @@ class Track(Entity):
         self.scroll_offset = 0.0
         
         # Grid lines (visual enhancement)
-        self.create_grid_lines()
+        self.grid_offset = 0.0
+        self.create_grid_lines(grid_lines)
         
         print(f"[TRACK] Created with {grid_lines} grid divisions")
     
-    def create_grid_lines(self):
+    def create_grid_lines(self, line_count):
         """
         Create visible grid lines for visual effect.
-        These are thin planes that also scroll with the texture.
-        """
-        # We'll create a few grid line entities
-        self.grid_lines = []
+        All lines are baked into one tiled texture on a single overlay plane,
+        scrolled by texture offset like the track itself (one draw call).
         
-        line_count = int(config.TRACK_LENGTH / config.GRID_SPACING)
-        
-        for i in range(line_count):
-            z_pos = i * config.GRID_SPACING
-            
-            line = Entity(
-                model='plane',
-                scale=(config.TRACK_WIDTH, 1, 0.1),
-                color=config.COLOR_GRID_LINES,
-                position=(0, 0.01, z_pos),  # Slightly above track to avoid z-fighting
-                rotation_x=0
-            )
-            self.grid_lines.append(line)
+        Args:
+            line_count (int): Number of grid lines along the track
+        """
+        self.grid_overlay = Entity(
+            parent=self,  # Inherits the track's width/length scale
+            model='plane',
+            texture=config.TEXTURE_GRID,
+            texture_scale=(1, line_count),  # One texture tile per grid spacing
+            color=config.COLOR_GRID_LINES,
+            position=(0, 0.01, 0),  # Slightly above track to avoid z-fighting
+            rotation_x=0,
+            collider=None
+        )
     
     def update(self, speed=None):
         """
-        Update track position to create scrolling effect.
+        Update track texture offset to create scrolling effect.
         
         Args:
             speed (float, optional): Current scroll speed. If None, uses config default.
@@ -72,18 +74,18 @@ class Track(Entity):
         # Use provided speed or default
         current_speed = speed if speed is not None else config.TRACK_SCROLL_SPEED
         
+        dt = time.dt
+        
         # Update scroll offset
-        scroll_speed = current_speed * config.GRID_ANIMATION_SPEED
-        self.scroll_offset += time.dt * scroll_speed
+        scroll_speed = current_speed * _TRACK_SCROLL_RATE
+        self.scroll_offset += dt * scroll_speed
         
         # Apply texture offset (creates scrolling effect)
         self.texture_offset = (0, self.scroll_offset)
         
-        # Move grid lines (for enhanced visual effect)
-        for line in self.grid_lines:
-            # Move line towards player (negative Z)
-            line.z -= current_speed * time.dt
-            
-            # Reset if it goes behind camera
-            if line.z < -config.GRID_SPACING:
-                line.z += config.TRACK_LENGTH
+        # Grid lines move at world speed: one texture tile per GRID_SPACING units.
+        # Wrapped to [0, 1) so the offset never loses float precision.
+        self.grid_offset = (
+            self.grid_offset + current_speed * dt * _GRID_SCROLL_RATE
+        ) % 1.0
+        self.grid_overlay.texture_offset = (0, self.grid_offset)
@@ -10,20 +10,39 @@ from entities.player import Player
 from entities.track import Track
 from systems.camera import CameraController
 from systems.spawner import ObstacleSpawner
+from systems.scroll import ScrollSystem
 from systems.collision import CollisionDetector
 from systems.score import ScoreManager
-from systems.ui import HUD
+from systems.ui import HUD, HUDSnapshot
 from systems.difficulty import DifficultyManager
 from systems.vfx import VFXManager
+from systems.game_state import GameState
+from utils.log import dlog, flush_log
+from utils.profiler import FrameProfiler
+from time import perf_counter
 
+_DEBUG_MODE = config.DEBUG_MODE
+_PROFILE = config.PROFILE
+_PROFILE_SECTIONS = (  # Profiler report order, as the sections run in a frame
+    'vfx', 'difficulty', 'camera', 'track', 'scroll', 'spawner', 'score', 'collision',
+    'debug', 'hud'
+)
+_DEBUG_TEXT_FRAME_MASK = config.DEBUG_TEXT_FRAME_MASK
+_INITIAL_SPEED = config.INITIAL_SPEED
+_SCORE_ORB = config.SCORE_ORB
+_COLOR_SHIELD = config.COLOR_SHIELD
+_SHAKE_SHIELD = (config.SHAKE_INTENSITY_SHIELD, config.SHAKE_DURATION_SHIELD)
+_SHAKE_COLLISION = (config.SHAKE_INTENSITY_COLLISION, config.SHAKE_DURATION_COLLISION)
+_PICKUP_COLORS = {'orb': config.COLOR_ORB, 'shield': config.COLOR_SHIELD}  # Burst color per item
 
 # ==========================================
 # GLOBAL STATE
 # ==========================================
-game_state = 'menu'  # menu, playing, paused, game_over
+game_state = GameState.MENU
 player = None
 track = None
 camera_controller = None
+scroll_system = None
 spawner = None
 collision_detector = None
 score_manager = None
@@ -32,6 +51,9 @@ difficulty_manager = None
 vfx_manager = None
 starfield = None
 debug_text = None
+debug_frame = 0          # Frames since start, for throttling the debug overlay
+last_debug_text = None   # Last string written to debug_text
+profiler = FrameProfiler(_PROFILE_SECTIONS)  # Only fed when config.PROFILE is on
 
 # ==========================================
 # INITIALIZATION
@@ -74,9 +96,13 @@ def init_entities():
     global difficulty_manager
     difficulty_manager = DifficultyManager()
 
+    # Create scroll system (moves obstacles and collectibles)
+    global scroll_system
+    scroll_system = ScrollSystem()
+
     # Create spawner
     global spawner
-    spawner = ObstacleSpawner(difficulty_manager)
+    spawner = ObstacleSpawner(scroll_system, difficulty_manager)
     
     # Create collision detector
     global collision_detector
@@ -112,149 +138,211 @@ def update():
     """
     Called every frame by Ursina.
     """
+    if _PROFILE:
+        t = perf_counter()
+    
+    # Update VFX in every state, so particle bursts and shake run out on pause/game over
+    if vfx_manager:
+        vfx_manager.update(time.dt)
+        # Apply shake to camera
+        if camera_controller:
+            camera_controller.shake_x = vfx_manager.shake_x
+            camera_controller.shake_y = vfx_manager.shake_y
+    
+    if _PROFILE:
+        profiler.lap('vfx', t)
+    
+    _UPDATE_HANDLERS[game_state]()
+    
+    if _PROFILE:
+        t = perf_counter()
+    
+    # Update HUD (every state; skipped inside HUD when nothing visible changed)
+    if hud and score_manager:
+        hud.update(build_hud_snapshot())
+    
+    if _PROFILE:
+        profiler.lap('hud', t)
+        profiler.end_frame()
+
+def update_idle():
+    """
+    Frame update for menu, pause and game over: the world stands still.
+    Nothing scrolls because ScrollSystem is only ticked by update_playing.
+    """
+
+def build_hud_snapshot():
+    """
+    Capture the values the HUD displays this frame.
+    
+    Returns:
+        HUDSnapshot: Score state quantized to what the HUD shows
+    """
+    return HUDSnapshot(
+        score=int(score_manager.score),
+        distance=int(score_manager.distance),
+        shield_active=score_manager.shield_active,
+        shield_tenths=round(score_manager.shield_timer * 10),
+        game_state=game_state,
+        orbs_collected=score_manager.orbs_collected,
+        high_score=int(score_manager.high_score)
+    )
+
+def update_playing():
+    """
+    Advance one frame of gameplay.
+    """
     global game_state
     
-    if game_state == 'paused':
-        # Still update HUD to show pause text
-        if hud and score_manager:
-            hud.update(
-                score_manager.score,
-                score_manager.distance,
-                score_manager.shield_active,
-                score_manager.shield_timer,
-                game_state,
-                score_manager.orbs_collected,
-                score_manager.high_score
-            )
-        return
-        
-    if game_state == 'menu':
-        # Still update HUD to show menu
-        if hud and score_manager:
-            hud.update(
-                score_manager.score,
-                score_manager.distance,
-                score_manager.shield_active,
-                score_manager.shield_timer,
-                game_state,
-                score_manager.orbs_collected,
-                score_manager.high_score
-            )
-        return
-    
-    if game_state != 'playing':
-        # Handle game over HUD update
-        if hud and score_manager:
-            hud.update(
-                score_manager.score,
-                score_manager.distance,
-                score_manager.shield_active,
-                score_manager.shield_timer,
-                game_state,
-                score_manager.orbs_collected,
-                score_manager.high_score
-            )
-        return
+    if _PROFILE:
+        t = perf_counter()
     
     # Update difficulty
-    current_speed = config.INITIAL_SPEED
+    current_speed = _INITIAL_SPEED
     if difficulty_manager and score_manager:
         current_speed, _ = difficulty_manager.update(score_manager.distance)
+    
+    if _PROFILE:
+        t = profiler.lap('difficulty', t)
         
-    # Update VFX
-    if vfx_manager:
-        vfx_manager.update()
-        # Apply shake to camera
-        if camera_controller:
-            camera_controller.shake_offset = vfx_manager.shake_offset
-        
+    # Frame delta time, read once and handed to the systems that need it
+    dt = time.dt
+    
     # Get current speed (already got it, but fallback if difficulty manager missing)
     if not difficulty_manager:
         current_speed = config.TRACK_SCROLL_SPEED
     
+    # Scroll delta for this frame
+    dz = current_speed * dt
+    
     # Update camera
-    camera_controller.update()
+    camera_controller.update(player.x, dt)
+    
+    if _PROFILE:
+        t = profiler.lap('camera', t)
     
     # Update track
     track.update(current_speed)
     
+    if _PROFILE:
+        t = profiler.lap('track', t)
+    
+    # Scroll obstacles and collectibles (despawns recycle immediately)
+    scroll_system.update(dz, dt)
+    
+    if _PROFILE:
+        t = profiler.lap('scroll', t)
+    
     # Update spawner
     if spawner:
-        spawner.update(current_speed)
-        spawner.cleanup_obstacles()
+        spawner.update(current_speed, dt)
+    
+    if _PROFILE:
+        t = profiler.lap('spawner', t)
     
     # Update score
     if score_manager:
-        score_manager.update(current_speed)
+        score_manager.update(current_speed, dt)
+    
+    if _PROFILE:
+        t = profiler.lap('score', t)
     
     # Check collisions
-    if collision_detector and player and spawner:
+    if collision_detector and player and scroll_system:
+        # Only the player's lane bucket can collide
+        lane = player.lane
+        
         # 1. Check Collectibles
-        collected_item = collision_detector.check_collectibles(player, spawner.obstacles)
+        collected_item = collision_detector.check_collectibles(
+            player,
+            scroll_system.collectibles_by_lane[lane],
+            scroll_system.collectible_z_by_lane[lane]
+        )
         if collected_item:
-            if collected_item.item_type == 'orb':
-                score_manager.add_points(config.SCORE_ORB, is_orb=True)
-                if vfx_manager:
-                    vfx_manager.create_particles(collected_item.position, config.COLOR_ORB)
-            elif collected_item.item_type == 'shield':
+            item_type = collected_item.item_type
+            if item_type == 'orb':
+                score_manager.add_points(_SCORE_ORB, is_orb=True)
+            elif item_type == 'shield':
                 score_manager.activate_shield()
-                if vfx_manager:
-                    vfx_manager.create_particles(collected_item.position, config.COLOR_SHIELD)
+            if vfx_manager:
+                vfx_manager.create_particles(collected_item.position, _PICKUP_COLORS[item_type])
             
             # Remove item
-            if collected_item in spawner.obstacles:
-                spawner.obstacles.remove(collected_item)
-            destroy(collected_item)
+            scroll_system.remove_collectible(collected_item)
             
         # 2. Check Obstacles
-        collided, obstacle = collision_detector.check_collision(player, spawner.obstacles)
+        collided, obstacle = collision_detector.check_collision(
+            player,
+            scroll_system.obstacles_by_lane[lane],
+            scroll_system.obstacle_z_by_lane[lane]
+        )
         if collided:
             # Check for shield
             if score_manager.shield_active:
-                print(f"[GAME] Shield protected against {obstacle.obs_type}!")
+                if _DEBUG_MODE:
+                    dlog(f"[GAME] Shield protected against {obstacle.obs_type}!")
                 if vfx_manager:
-                    vfx_manager.shake_camera(config.SHAKE_INTENSITY_SHIELD, config.SHAKE_DURATION_SHIELD)
-                    vfx_manager.create_particles(obstacle.position, config.COLOR_SHIELD)
+                    vfx_manager.shake_camera(*_SHAKE_SHIELD)
+                    vfx_manager.create_particles(obstacle.position, _COLOR_SHIELD)
                 
-                # Optional: Destroy obstacle on shield hit
-                if obstacle in spawner.obstacles:
-                    spawner.obstacles.remove(obstacle)
-                destroy(obstacle)
+                # Optional: Remove obstacle on shield hit
+                scroll_system.remove_obstacle(obstacle)
             else:
-                print(f"[GAME] Collision with {obstacle.obs_type} obstacle!")
+                if _DEBUG_MODE:
+                    dlog(f"[GAME] Collision with {obstacle.obs_type} obstacle!")
                 if vfx_manager:
-                    vfx_manager.shake_camera(config.SHAKE_INTENSITY_COLLISION, config.SHAKE_DURATION_COLLISION)
+                    vfx_manager.shake_camera(*_SHAKE_COLLISION)
                 
-                game_state = 'game_over'
-                print(f"[GAME] GAME OVER - Final Score: {int(score_manager.score)}")
+                game_state = GameState.GAME_OVER
+                if _DEBUG_MODE:
+                    dlog(f"[GAME] GAME OVER - Final Score: {int(score_manager.score)}")
     
-    # Update HUD
-    if hud and score_manager:
-        hud.update(
-            score_manager.score,
-            score_manager.distance,
-            score_manager.shield_active,
-            score_manager.shield_timer,
-            game_state,
-            score_manager.orbs_collected,
-            score_manager.high_score
-        )
+    if _PROFILE:
+        t = profiler.lap('collision', t)
     
     # Update debug text
-    if config.DEBUG_MODE and debug_text:
-        state_display = player.vertical_state.upper()
-        if player.vertical_state == 'jumping':
-            progress_percent = int(player.jump_progress * 100)
-            state_display = f"JUMPING ({progress_percent}%)"
-        elif player.vertical_state == 'sliding':
-            remaining = player.slide_timer
-            state_display = f"SLIDING ({remaining:.1f}s)"
+    if _DEBUG_MODE and debug_text:
+        update_debug_text()
+    
+    if _PROFILE:
+        profiler.lap('debug', t)
+
+def update_debug_text():
+    """
+    Refresh the debug overlay every few frames, only when its text changed.
+    """
+    global debug_frame, last_debug_text
+    
+    debug_frame += 1
+    if debug_frame & _DEBUG_TEXT_FRAME_MASK:
+        return  # Throttled: overlay refreshes at a fraction of the frame rate
+    
+    state_display = player.vertical_state.upper()
+    if player.vertical_state == 'jumping':
+        progress_percent = int(player.jump_progress * 100)
+        state_display = f"JUMPING ({progress_percent}%)"
+    elif player.vertical_state == 'sliding':
+        remaining = player.slide_timer
+        state_display = f"SLIDING ({remaining:.1f}s)"
+    
+    score_display = f"Score: {int(score_manager.score)}"
+    if score_manager.shield_active:
+        score_display += f" | SHIELD ({score_manager.shield_timer:.1f}s)"
         
-        score_display = f"Score: {int(score_manager.score)}"
-        if score_manager.shield_active:
-            score_display += f" | SHIELD ({score_manager.shield_timer:.1f}s)"
-            
-        debug_text.text = f"Lane: {player.lane} | State: {state_display}\n{score_display}"
+    text = f"Lane: {player.lane} | State: {state_display}\n{score_display}"
+    
+    # Assigning .text rebuilds the text mesh, so skip it when nothing changed
+    if text != last_debug_text:
+        debug_text.text = text
+        last_debug_text = text
+
+# Per-frame handler for each GameState, indexed by state value
+_UPDATE_HANDLERS = (
+    update_idle,     # MENU
+    update_playing,  # PLAYING
+    update_idle,     # PAUSED
+    update_idle,     # GAME_OVER
+)
 
 def input(key):
     """
@@ -262,34 +350,43 @@ def input(key):
     """
     global game_state
     
+    if key == 'f3' and _PROFILE:
+        profiler.dump()
+    
     if key == 'escape':
-        if game_state == 'menu':
+        if game_state == GameState.MENU:
             print("[INPUT] ESC pressed - Exiting game")
+            score_manager.flush_high_score()
             quit()
-        elif game_state == 'playing':
-            game_state = 'paused'
-            print("[GAME] Paused")
-        elif game_state == 'paused':
-            game_state = 'playing'
-            print("[GAME] Resumed")
+        elif game_state == GameState.PLAYING:
+            game_state = GameState.PAUSED
+            if config.DEBUG_MODE:
+                dlog("[GAME] Paused")
+        elif game_state == GameState.PAUSED:
+            game_state = GameState.PLAYING
+            if config.DEBUG_MODE:
+                dlog("[GAME] Resumed")
             
     # Menu controls
-    if game_state == 'menu':
+    if game_state == GameState.MENU:
         if key == 'enter':
-            game_state = 'playing'
-            print("[GAME] Started")
+            game_state = GameState.PLAYING
+            if config.DEBUG_MODE:
+                dlog("[GAME] Started")
             
     # Pause controls
     if key == 'p':
-        if game_state == 'playing':
-            game_state = 'paused'
-            print("[GAME] Paused")
-        elif game_state == 'paused':
-            game_state = 'playing'
-            print("[GAME] Resumed")
+        if game_state == GameState.PLAYING:
+            game_state = GameState.PAUSED
+            if config.DEBUG_MODE:
+                dlog("[GAME] Paused")
+        elif game_state == GameState.PAUSED:
+            game_state = GameState.PLAYING
+            if config.DEBUG_MODE:
+                dlog("[GAME] Resumed")
     
     # Lane switching
-    if game_state == 'playing':
+    if game_state == GameState.PLAYING:
         if key == 'a' or key == 'left arrow':
             player.switch_lane(-1)
             # if vfx_manager:
@@ -308,13 +405,20 @@ def input(key):
             player.slide()
             
     # Restart
-    if game_state == 'game_over':
+    if game_state == GameState.GAME_OVER:
         if key == 'r':
             reset_game()
         elif key == 'escape':
-            game_state = 'menu'
+            game_state = GameState.MENU
             reset_game()
-            game_state = 'menu' # Ensure it stays menu after reset
+            game_state = GameState.MENU # Ensure it stays menu after reset
+
+def flush_log_periodically():
+    """
+    Flush the buffered debug log, then schedule the next flush.
+    """
+    flush_log()
+    invoke(flush_log_periodically, delay=config.LOG_FLUSH_INTERVAL)
 
 def reset_game():
     """
@@ -322,20 +426,24 @@ def reset_game():
     """
     global game_state
     
-    print("[GAME] Restarting...")
+    if config.DEBUG_MODE:
+        dlog("[GAME] Restarting...")
     
     # Reset entities
     player.reset()
+    scroll_system.reset()
     spawner.reset()
     score_manager.reset()
     difficulty_manager.reset()
+    vfx_manager.clear_particles()
     
     # Reset camera
-    camera_controller.update()
+    camera_controller.update(player.x, time.dt)
     
     # Reset state
-    game_state = 'playing'
-    print("[GAME] Restart complete")
+    game_state = GameState.PLAYING
+    if config.DEBUG_MODE:
+        dlog("[GAME] Restart complete")
 
 # ==========================================
 # ENTRY POINT
@@ -347,7 +455,8 @@ if __name__ == '__main__':
         'assets/wall_texture.png',
         'assets/wood_texture.png',
         'assets/metal_texture.png',
-        'assets/orb_texture.png'
+        'assets/orb_texture.png',
+        'assets/grid_texture.png'
     ]
     
     missing_textures = [tex for tex in required_textures if not os.path.exists(tex)]
@@ -360,7 +469,8 @@ if __name__ == '__main__':
             generate_wall_texture,
             generate_wood_texture,
             generate_metal_texture,
-            generate_orb_texture
+            generate_orb_texture,
+            generate_grid_texture
         )
         
         ensure_assets_dir()
@@ -375,12 +485,17 @@ if __name__ == '__main__':
             generate_metal_texture()
         if not os.path.exists('assets/orb_texture.png'):
             generate_orb_texture()
+        if not os.path.exists('assets/grid_texture.png'):
+            generate_grid_texture()
         
         print("[SETUP] Texture generation complete!")
 
     app = init_game()
     init_entities()
     
+    if config.DEBUG_MODE:
+        flush_log_periodically()
+    
     print("[READY] Game ready - Use A/D or Arrow Keys to switch lanes")
     print("[READY] Track is scrolling - Player movement creates camera follow")
     print("[READY] Press ESC to exit")
@@ -2,12 +2,14 @@
 Systems Module - Game Logic
 """
 
+from systems.game_state import GameState
 from systems.camera import CameraController
 from systems.spawner import ObstacleSpawner
+from systems.scroll import ScrollSystem
 from systems.collision import CollisionDetector
 from systems.score import ScoreManager
-from systems.ui import HUD
+from systems.ui import HUD, HUDSnapshot
 from systems.difficulty import DifficultyManager
 from systems.vfx import VFXManager
 
-__all__ = ['CameraController', 'ObstacleSpawner', 'CollisionDetector', 'ScoreManager', 'HUD', 'DifficultyManager', 'VFXManager']
+__all__ = ['GameState', 'CameraController', 'ObstacleSpawner', 'ScrollSystem', 'CollisionDetector', 'ScoreManager', 'HUD', 'HUDSnapshot', 'DifficultyManager', 'VFXManager']
@@ -10,6 +10,13 @@ Y and Z are fixed, only X position follows.
 from ursina import *
 import config
 
+_FOLLOW_RATE = config.CAMERA_FOLLOW_SPEED * 60  # Follow factor per second (tuned at 60 FPS)
+_TARGET_Y = config.CAMERA_POSITION[1]           # Fixed height
+_TARGET_Z = config.CAMERA_POSITION[2]           # Fixed depth
+_TILT_ANGLE = config.CAMERA_TILT_ANGLE
+_TILT_SPEED = config.CAMERA_TILT_SPEED
+_SETTLE_EPSILON = config.CAMERA_SETTLE_EPSILON
+
 class CameraController:
     """
     Manages camera behavior.
@@ -28,59 +35,70 @@ class CameraController:
         self.target_fov = 90
         
         # VFX
-        self.shake_offset = Vec3(0, 0, 0)
+        self.shake_x = 0.0  # Set from VFXManager each frame
+        self.shake_y = 0.0
         self.target_tilt = 0.0
         self.current_tilt = 0.0
         
+        # Player X the camera last came to rest on (None while still moving)
+        self.settled_x = None
+        
         # Set initial position
         camera.position = self.player.position + self.offset
         camera.rotation_x = config.CAMERA_ROTATION_X
         
         print("[CAMERA] Initialized")
     
-    def update(self):
+    def update(self, player_x, dt):
         """
         Update camera position to follow player smoothly.
-        """
-        if not self.player:
-            return
-            
-        # Calculate target position
-        # We only follow X, keep Y and Z relative
-        target_pos = self.player.position + self.offset
-        
-        # Smoothly interpolate to target X
-        # We want strict following for gameplay, but smooth for feel
-        # Actually, for arcade runners, camera usually stays centered on track X=0
-        # or follows player slightly.
-        # Let's follow player X with some lag.
         
-        # Current implementation:
-        # camera.position = lerp(camera.position, target_pos, config.CAMERA_FOLLOW_SPEED)
-        
-        # Better implementation for this genre:
-        # Keep Z fixed relative to player (or track)
-        # Keep Y fixed relative to ground (or player jump?)
-        # Follow X loosely.
-        
-        # Let's stick to simple lerp for now but ensure Z is correct
-        # The player stays at Z=0, track moves. So camera should stay at Z=-12.
+        Args:
+            player_x (float): Player X this frame (read once by the caller)
+            dt (float): Frame delta time in seconds
+        """
+        sx = self.shake_x
+        sy = self.shake_y
+        shaking = sx or sy
         
-        target_x = self.player.x * 0.5 # Follow a bit, but not fully
-        target_y = config.CAMERA_POSITION[1] # Fixed height
-        target_z = config.CAMERA_POSITION[2] # Fixed depth
+        # Player holding a lane and no shake: camera is already at rest
+        if player_x == self.settled_x and not shaking:
+            return
         
-        target_pos = Vec3(target_x, target_y, target_z)
+        # Follow player X loosely (arcade runners keep the camera near the track
+        # center); Y and Z stay fixed since the player stays at Z=0 and the
+        # track moves.
+        target_x = player_x * 0.5 # Follow a bit, but not fully
+        target_tilt = -player_x * _TILT_ANGLE
+        self.target_tilt = target_tilt
         
-        # Apply shake
-        target_pos += self.shake_offset
+        # Scalar lerp per axis toward target + shake (no Vec3 temporaries)
+        t = _FOLLOW_RATE * dt
+        cx = camera.x
+        cy = camera.y
+        cz = camera.z
+        x = cx + (target_x + sx - cx) * t
+        y = cy + (_TARGET_Y + sy - cy) * t
+        z = cz + (_TARGET_Z - cz) * t  # Shake is screen-plane only
         
-        camera.position = lerp(camera.position, target_pos, config.CAMERA_FOLLOW_SPEED * 60 * time.dt)
+        # Tilt based on player X
+        tilt = self.current_tilt
+        tilt += (target_tilt - tilt) * _TILT_SPEED * dt
         
-        # Tilt logic
-        # Tilt based on player lane position or movement?
-        # Let's tilt based on player X
-        self.target_tilt = -self.player.x * config.CAMERA_TILT_ANGLE
-        self.current_tilt = lerp(self.current_tilt, self.target_tilt, config.CAMERA_TILT_SPEED * time.dt)
+        if (
+            not shaking
+            and abs(target_x - x) < _SETTLE_EPSILON
+            and abs(_TARGET_Y - y) < _SETTLE_EPSILON
+            and abs(_TARGET_Z - z) < _SETTLE_EPSILON
+            and abs(target_tilt - tilt) < _SETTLE_EPSILON
+        ):
+            # Close enough: snap onto the target and stop updating until it moves
+            x, y, z = target_x, _TARGET_Y, _TARGET_Z
+            tilt = target_tilt
+            self.settled_x = player_x
+        else:
+            self.settled_x = None
         
-        camera.rotation_z = self.current_tilt
+        camera.position = (x, y, z)
+        self.current_tilt = tilt
+        camera.rotation_z = tilt
@@ -5,9 +5,21 @@ Uses discrete lane matching and distance thresholds.
 No physics collision - pure logic.
 """
 
+from bisect import bisect_left, bisect_right
+
 import config
-from entities.obstacle import Obstacle
-from entities.collectible import Collectible
+
+_OBSTACLE_THRESHOLD = config.OBSTACLE_COLLISION_THRESHOLD
+_PICKUP_RADIUS = config.PLAYER_COLLISION_RADIUS
+
+# Which obstacle types each vertical state avoids.
+# Rows follow config.PLAYER_VERTICAL_STATES, columns follow config.OBSTACLE_TYPES.
+_AVOID = (
+    # low    high   moving
+    (False, False, False),  # grounded (moving can never be avoided: change lanes)
+    (True,  False, False),  # jumping: clears low obstacles
+    (False, True,  False),  # sliding: passes under high obstacles
+)
 
 class CollisionDetector:
     """
@@ -15,6 +27,7 @@ class CollisionDetector:
     
     Collision rules:
     - Same lane AND close distance = potential collision
+      (callers pass only the player's lane bucket from ScrollSystem)
     - Jump avoids LOW obstacles
     - Slide avoids HIGH obstacles
     - Cannot avoid MOVING obstacles (must change lanes)
@@ -23,35 +36,33 @@ class CollisionDetector:
     def __init__(self):
         print("[COLLISION] Initialized")
     
-    def check_collision(self, player, obstacles):
+    def check_collision(self, player, obstacles, obstacle_z):
         """
         Check if player collides with any obstacle.
         
         Args:
-            player: Player entity with lane and vertical_state
-            obstacles: List of Obstacle entities
+            player: Player entity with lane and vertical_state_idx
+            obstacles: Obstacle entities in the player's lane (lane bucket)
+            obstacle_z: Sorted list of obstacle Z positions, parallel to obstacles
         
         Returns:
             tuple: (collided, obstacle) or (False, None)
         """
-        player_z = player.z_position if hasattr(player, 'z_position') else 0
+        # Hit window on the Z axis: just ahead of the player, inclusive
+        near_z = player.z_position
+        far_z = near_z + _OBSTACLE_THRESHOLD
+        avoids = _AVOID[player.vertical_state_idx]  # Row for the player's state
         
-        for obs in obstacles:
-            # Skip if not an obstacle (e.g. collectible)
-            if not isinstance(obs, Obstacle):
-                continue
-                
-            # Check lane match
-            if obs.lane != player.lane:
-                continue  # Not in same lane
-            
-            # Check distance
-            distance = obs.z_position - player_z
-            if distance < 0 or distance > config.OBSTACLE_COLLISION_THRESHOLD:
-                continue  # Too far away
+        # Lane match is guaranteed by the bucket, so only distance and state remain.
+        # The bucket is sorted by Z: binary-search the near edge of the window
+        # and stop at the first obstacle past the far edge.
+        for i in range(bisect_left(obstacle_z, near_z), len(obstacle_z)):
+            if obstacle_z[i] > far_z:
+                break  # Everything further on is out of reach
+            obs = obstacles[i]
             
             # Check if player can avoid
-            if self.can_avoid(player.vertical_state, obs.obs_type):
+            if avoids[obs.obs_type_idx]:
                 continue  # Successfully avoided
             
             # Collision detected!
@@ -59,56 +70,25 @@ class CollisionDetector:
         
         return (False, None)
     
-    def check_collectibles(self, player, entities):
+    def check_collectibles(self, player, collectibles, collectible_z):
         """
         Check if player collects any items.
         
         Args:
             player: Player entity
-            entities: List of entities (obstacles + collectibles)
+            collectibles: Collectible entities in the player's lane (lane bucket)
+            collectible_z: Sorted list of collectible Z positions, parallel to collectibles
             
         Returns:
             Collectible or None
         """
-        player_z = player.z_position if hasattr(player, 'z_position') else 0
+        # Pickup window (generous hit box), open on both ends
+        near_z = player.z_position - _PICKUP_RADIUS
+        far_z = player.z_position + _PICKUP_RADIUS
         
-        for entity in entities:
-            # Skip if not a collectible
-            if not isinstance(entity, Collectible):
-                continue
-            
-            # Check lane match
-            if entity.lane != player.lane:
-                continue
-            
-            # Check distance (close enough to collect)
-            distance = abs(entity.z_position - player_z)
-            if distance < config.PLAYER_COLLISION_RADIUS: # generous hit box
-                return entity
+        # Sorted by Z: the first entry past the near edge is the only candidate
+        i = bisect_right(collectible_z, near_z)
+        if i < len(collectible_z) and collectible_z[i] < far_z:
+            return collectibles[i]
         
         return None
-
-    def can_avoid(self, player_state, obstacle_type):
-        """
-        Determine if player's current state avoids obstacle type.
-        
-        Args:
-            player_state (str): 'grounded', 'jumping', or 'sliding'
-            obstacle_type (str): 'low', 'high', or 'moving'
-        
-        Returns:
-            bool: True if avoided, False if collision
-        """
-        # Low obstacles: jump to avoid
-        if obstacle_type == 'low':
-            return player_state == 'jumping'
-        
-        # High obstacles: slide to avoid
-        elif obstacle_type == 'high':
-            return player_state == 'sliding'
-        
-        # Moving obstacles: cannot avoid (must be in different lane)
-        elif obstacle_type == 'moving':
-            return False
-        
-        return False
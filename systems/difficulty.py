@@ -3,6 +3,13 @@ Difficulty System - Progressive Challenge
 """
 
 import config
+from utils.log import dlog
+
+# Speed curve: speed = INITIAL + distance * _SPEED_PER_DISTANCE
+_INITIAL_SPEED = config.INITIAL_SPEED
+_MAX_SPEED = config.MAX_SPEED
+_SPEED_PER_DISTANCE = 2.0 / config.DIFFICULTY_SCALE_DISTANCE
+_INV_INITIAL_SPEED = 1.0 / config.INITIAL_SPEED
 
 class DifficultyManager:
     """
@@ -21,19 +28,24 @@ class DifficultyManager:
         
         Args:
             distance (float): Total distance traveled
+        
+        Returns:
+            tuple: (current_speed, difficulty_multiplier)
         """
+        # Distance only grows during a run, so once capped nothing changes
+        if self.current_speed >= _MAX_SPEED:
+            return self.current_speed, self.difficulty_multiplier
+        
         # Calculate speed based on distance
         # Formula: initial + (distance / scale) * 2
         # Example: 20 + (500 / 500) * 2 = 22 (+10% every 500m)
-        
-        speed_increase = (distance / config.DIFFICULTY_SCALE_DISTANCE) * 2.0
-        target_speed = config.INITIAL_SPEED + speed_increase
+        target_speed = _INITIAL_SPEED + distance * _SPEED_PER_DISTANCE
         
         # Cap at max speed
-        self.current_speed = min(target_speed, config.MAX_SPEED)
+        self.current_speed = min(target_speed, _MAX_SPEED)
         
         # Calculate multiplier (1.0 to 2.5)
-        self.difficulty_multiplier = self.current_speed / config.INITIAL_SPEED
+        self.difficulty_multiplier = self.current_speed * _INV_INITIAL_SPEED
 
         return self.current_speed, self.difficulty_multiplier
 
@@ -59,4 +71,5 @@ class DifficultyManager:
         self.current_speed = config.INITIAL_SPEED
         self.difficulty_multiplier = 1.0
         config.TRACK_SCROLL_SPEED = config.INITIAL_SPEED
-        print("[DIFFICULTY] Reset")
+        if config.DEBUG_MODE:
+            dlog("[DIFFICULTY] Reset")
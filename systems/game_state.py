@@ -0,0 +1,17 @@
+"""
+Game State - Top-Level Game Modes
+
+Small integer states, so per-frame code can index handler tables
+instead of comparing strings.
+"""
+
+from enum import IntEnum
+
+class GameState(IntEnum):
+    """
+    Top-level game mode. Values are contiguous from 0 (usable as list indices).
+    """
+    MENU = 0
+    PLAYING = 1
+    PAUSED = 2
+    GAME_OVER = 3
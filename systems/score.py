@@ -4,14 +4,20 @@
 Score System - Track Progress and Rewards
 """
 
+import atexit
+import json
+import os
 import time
 
 import config
-import os
-import json
+from utils.log import dlog
 
 HIGH_SCORE_FILE = 'high_score.json'
 
+# Score rates
+_SCORE_PER_DISTANCE = config.SCORE_PER_UNIT / 10.0  # Distance points, scaled down
+_SCORE_PER_SECOND = config.SCORE_PER_SECOND
+
 class ScoreManager:
     """
     Manages game score, distance, and high score.
@@ -20,7 +26,7 @@ class ScoreManager:
     def __init__(self):
         self.score = 0.0
         self.distance = 0.0
-        self.high_score = 0.0  # Could load from file in future
+        self.high_score = 0.0  # Replaced by load_high_score() below
         self.orbs_collected = 0
         self.shield_active = False
         self.shield_timer = 0.0
@@ -28,6 +34,12 @@ class ScoreManager:
         # Load high score from file
         self.load_high_score()
         
+        # High score writes are deferred: marked dirty on improvement,
+        # flushed at most every HIGH_SCORE_FLUSH_INTERVAL and on exit
+        self._high_score_dirty = False
+        self._last_flush = time.monotonic()
+        atexit.register(self.flush_high_score)
+        
         print("[SCORE] Initialized")
     
     def load_high_score(self):
@@ -45,32 +57,49 @@ class ScoreManager:
             self.high_score = 0
             
     def save_high_score(self):
-        """Save high score to file."""
+        """
+        Save high score to file.
+        Written to a temp file first and swapped in, so a crash mid-write
+        never leaves a truncated file behind.
+        """
+        tmp_file = HIGH_SCORE_FILE + '.tmp'
         try:
-            with open(HIGH_SCORE_FILE, 'w') as f:
+            with open(tmp_file, 'w') as f:
                 json.dump({'high_score': self.high_score}, f)
-                print(f"[SCORE] Saved high score: {self.high_score}")
+            os.replace(tmp_file, HIGH_SCORE_FILE)
+            self._high_score_dirty = False
+            self._last_flush = time.monotonic()
+            print(f"[SCORE] Saved high score: {self.high_score}")
         except Exception as e:
             print(f"[SCORE] Could not save high score: {e}")
     
-    def update(self, speed):
+    def flush_high_score(self):
+        """
+        Write the high score if it improved since the last save.
+        Registered with atexit, and safe to call any time.
+        """
+        if self._high_score_dirty:
+            self.save_high_score()
+    
+    def update(self, speed, dt):
         """
         Update score based on time and distance.
         
         Args:
             speed (float): Current movement speed
+            dt (float): Frame delta time in seconds
         """
-        # Distance score (units traveled)
-        distance_delta = speed * time.dt
-        self.distance += distance_delta
-        self.score += distance_delta * config.SCORE_PER_UNIT / 10.0 # Scale down a bit or use config
+        if dt <= 0.0:
+            return  # Zero-length frame (e.g. first frame after a stall): nothing advances
         
-        # Survival score (time based)
-        self.score += config.SCORE_PER_SECOND * time.dt
+        # Distance score (units traveled) + survival score (time based)
+        distance_delta = speed * dt
+        self.distance += distance_delta
+        self.score += distance_delta * _SCORE_PER_DISTANCE + _SCORE_PER_SECOND * dt
         
         # Update shield timer
         if self.shield_active:
-            self.shield_timer -= time.dt
+            self.shield_timer -= dt
             if self.shield_timer <= 0:
                 self.deactivate_shield()
     
@@ -81,9 +110,9 @@ class ScoreManager:
         self.score += amount
         if is_orb:
             self.orbs_collected += 1
-            print(f"[SCORE] +{amount} (Total: {int(self.score)}) | Orbs: {self.orbs_collected}")
-        else:
-            print(f"[SCORE] +{amount} (Total: {int(self.score)})")
+        
+        if config.DEBUG_MODE:
+            dlog(f"[SCORE] +{amount} (Total: {int(self.score)}) | Orbs: {self.orbs_collected}")
     
     def activate_shield(self):
         """
@@ -91,14 +120,16 @@ class ScoreManager:
         """
         self.shield_active = True
         self.shield_timer = config.SHIELD_DURATION
-        print("[SCORE] Shield ACTIVATED!")
+        if config.DEBUG_MODE:
+            dlog("[SCORE] Shield ACTIVATED!")
     
     def deactivate_shield(self):
         """
         Deactivate invincibility shield.
         """
         self.shield_active = False
-        print("[SCORE] Shield expired")
+        if config.DEBUG_MODE:
+            dlog("[SCORE] Shield expired")
     
     def reset(self):
         """
@@ -106,7 +137,11 @@ class ScoreManager:
         """
         if self.score > self.high_score:
             self.high_score = int(self.score)
-            self.save_high_score()  # Save to file
+            self._high_score_dirty = True
+            
+            # Rapid restarts only mark dirty; the file catches up later or on exit
+            if time.monotonic() - self._last_flush > config.HIGH_SCORE_FLUSH_INTERVAL:
+                self.save_high_score()
         
         self.score = 0.0
         self.distance = 0.0
@@ -115,4 +150,5 @@ class ScoreManager:
         # Shield state
         self.shield_active = False
         self.shield_timer = 0.0
-        print("[SCORE] Reset")
+        if config.DEBUG_MODE:
+            dlog("[SCORE] Reset")
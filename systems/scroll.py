@@ -0,0 +1,192 @@
+"""
+Scroll System - Batched World Scrolling
+
+Moves every scrolling entity toward the player in one tick, instead of
+Ursina dispatching a separate update() to each obstacle and collectible.
+"""
+
+from bisect import bisect_left, bisect_right
+
+import config
+from utils.log import dlog
+
+_LANES = range(config.LANE_COUNT)
+_DESPAWN_DISTANCE = config.OBSTACLE_DESPAWN_DISTANCE
+
+class ScrollSystem:
+    """
+    Owns the active scrolling entities and advances them each frame.
+
+    Entities are bucketed by lane, so collision only has to look at the
+    player's lane. Z positions live in flat float lists parallel to each
+    bucket (structure of arrays), so scrolling, despawn checks and
+    collision queries read plain floats instead of entity attributes.
+
+    Each bucket is kept sorted by Z (nearest first). Everything scrolls at
+    the same rate, so new spawns append at the far end, despawns come off
+    the near end as one slice, and collision can binary-search its window.
+    Removals preserve order; despawned entities are handed back to their
+    pools via cleanup().
+
+    Gameplay removals (pickups, shield hits) are O(1): the entity is
+    recycled on the spot, which disables it, and its lane is marked stale.
+    The stale buckets are compacted at the start of the next update(),
+    before the spawner can hand the recycled entity out again.
+    """
+
+    def __init__(self):
+        """
+        Initialize scroll system.
+        """
+        self.obstacles_by_lane = [[] for _ in _LANES]
+        self.obstacle_z_by_lane = [[] for _ in _LANES]  # Parallel to obstacles_by_lane
+        self.collectibles_by_lane = [[] for _ in _LANES]
+        self.collectible_z_by_lane = [[] for _ in _LANES]  # Parallel to collectibles_by_lane
+
+        # Lanes holding disabled entities awaiting compaction
+        self.stale_obstacle_lanes = set()
+        self.stale_collectible_lanes = set()
+
+        print("[SCROLL] Initialized")
+
+    def add_obstacle(self, obs):
+        """
+        Start scrolling a freshly spawned obstacle.
+
+        Args:
+            obs (Obstacle): Enabled obstacle, already placed at its spawn Z
+        """
+        # Spawns happen at the far end, so appending keeps the bucket sorted
+        self.obstacles_by_lane[obs.lane].append(obs)
+        self.obstacle_z_by_lane[obs.lane].append(obs.z)
+
+    def add_collectible(self, item):
+        """
+        Start scrolling a freshly spawned collectible.
+
+        Args:
+            item (Collectible): Enabled collectible, already placed at its spawn Z
+        """
+        self.collectibles_by_lane[item.lane].append(item)
+        self.collectible_z_by_lane[item.lane].append(item.z)
+
+    def remove_obstacle(self, obs):
+        """
+        Stop scrolling an obstacle and recycle it.
+
+        Args:
+            obs (Obstacle): Active obstacle
+        """
+        self.stale_obstacle_lanes.add(obs.lane)
+        obs.cleanup()  # Disabled now; its slot is dropped on the next update
+
+    def remove_collectible(self, item):
+        """
+        Stop scrolling a collectible and recycle it.
+
+        Args:
+            item (Collectible): Active collectible
+        """
+        self.stale_collectible_lanes.add(item.lane)
+        item.cleanup()  # Disabled now; its slot is dropped on the next update
+
+    def update(self, dz, dt):
+        """
+        Scroll everything toward the player by this frame's delta.
+
+        Args:
+            dz (float): Distance to scroll this frame (speed * dt)
+            dt (float): Frame delta time in seconds (for moving obstacles)
+        """
+        # 0. Drop slots recycled by gameplay since the last update
+        if self.stale_obstacle_lanes:
+            for lane in self.stale_obstacle_lanes:
+                self._compact(self.obstacles_by_lane[lane], self.obstacle_z_by_lane[lane])
+            self.stale_obstacle_lanes.clear()
+        if self.stale_collectible_lanes:
+            for lane in self.stale_collectible_lanes:
+                self._compact(self.collectibles_by_lane[lane], self.collectible_z_by_lane[lane])
+            self.stale_collectible_lanes.clear()
+
+        # 1. Obstacles (moving ones also shift laterally and may change bucket)
+        lane_changes = []
+        for lane in _LANES:
+            obstacles = self.obstacles_by_lane[lane]
+            obstacle_z = self.obstacle_z_by_lane[lane]
+            self._scroll(obstacles, obstacle_z, dz)
+
+            moved = None
+            for i, obs in enumerate(obstacles):
+                tick = obs.tick  # Selected per type at construction
+                if tick is not None:
+                    tick(dt)
+                    if obs.lane != lane:
+                        if moved is None:
+                            moved = []
+                        moved.append(i)
+
+            if moved is not None:
+                # Pop back to front so earlier indices stay valid
+                for i in reversed(moved):
+                    lane_changes.append((obstacles.pop(i), obstacle_z.pop(i)))
+
+        # Re-bucket after the sweep so nothing is scrolled twice
+        for obs, z in lane_changes:
+            obstacle_z = self.obstacle_z_by_lane[obs.lane]
+            i = bisect_right(obstacle_z, z)
+            obstacle_z.insert(i, z)
+            self.obstacles_by_lane[obs.lane].insert(i, obs)
+
+        # 2. Collectibles (never change lane)
+        for lane in _LANES:
+            self._scroll(self.collectibles_by_lane[lane], self.collectible_z_by_lane[lane], dz)
+
+    def reset(self):
+        """
+        Recycle every active entity.
+        """
+        for bucket in self.obstacles_by_lane + self.collectibles_by_lane:
+            for entity in bucket:
+                entity.cleanup()
+            bucket.clear()
+        for z_list in self.obstacle_z_by_lane + self.collectible_z_by_lane:
+            z_list.clear()
+        self.stale_obstacle_lanes.clear()
+        self.stale_collectible_lanes.clear()
+        if config.DEBUG_MODE:
+            dlog("[SCROLL] Reset")
+
+    def _scroll(self, entities, zs, dz):
+        """
+        Move one sorted bucket toward the player and recycle what passed it.
+
+        Args:
+            entities (list): Bucket of entities, sorted by Z
+            zs (list): Z list parallel to entities
+            dz (float): Distance to scroll
+        """
+        for i, entity in enumerate(entities):
+            z = zs[i] - dz
+            zs[i] = z
+            entity.z = z
+
+        # Sorted, so everything behind the despawn line is one leading slice
+        dead = bisect_left(zs, _DESPAWN_DISTANCE)
+        if dead:
+            for entity in entities[:dead]:
+                entity.cleanup()
+            del entities[:dead]
+            del zs[:dead]
+
+    def _compact(self, entities, zs):
+        """
+        Drop disabled (already recycled) entities, keeping the Z order.
+
+        Args:
+            entities (list): Bucket of entities, sorted by Z
+            zs (list): Z list parallel to entities
+        """
+        keep = [i for i, entity in enumerate(entities) if entity.enabled]
+        if len(keep) != len(entities):
+            entities[:] = [entities[i] for i in keep]
+            zs[:] = [zs[i] for i in keep]
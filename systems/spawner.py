@@ -3,10 +3,23 @@ Spawner System - Procedural Obstacle Generation
 """
 
 import random
-from ursina import *
 from entities.obstacle import Obstacle
 from entities.collectible import Collectible
+from entities.pool import ObstaclePool, CollectiblePool
 import config
+from utils.log import dlog
+
+_SPAWN_INTERVAL_MIN = config.SPAWN_INTERVAL_MIN
+_SPAWN_INTERVAL_MAX = config.SPAWN_INTERVAL_MAX
+_COLLECTIBLE_SPAWN_CHANCE = config.COLLECTIBLE_SPAWN_CHANCE
+_SPAWN_Z = config.OBSTACLE_SPAWN_DISTANCE
+_OBSTACLE_TYPES = config.OBSTACLE_TYPES
+
+# For each lane, the lanes a spawn may use instead (never repeat the last lane)
+_OTHER_LANES = tuple(
+    tuple(other for other in range(config.LANE_COUNT) if other != lane)
+    for lane in range(config.LANE_COUNT)
+)
 
 class ObstacleSpawner:
     """
@@ -14,35 +27,62 @@ class ObstacleSpawner:
     Creates varied patterns while avoiding impossible situations.
     """
     
-    def __init__(self, difficulty_manager=None):
+    def __init__(self, scroll_system, difficulty_manager=None):
         self.spawn_timer = config.SPAWN_INTERVAL_MAX
-        self.obstacles = []  # Track all active obstacles (and collectibles)
+        self.scroll_system = scroll_system  # Owns all active obstacles and collectibles
         self.last_lane = 1  # Avoid spawning same lane twice
         self.difficulty_manager = difficulty_manager
         
+        # Recycled entities (despawned obstacles return here instead of being destroyed)
+        self.obstacle_pool = ObstaclePool()
+        self.collectible_pool = CollectiblePool()
+        self.prefill_pools(config.POOL_PREFILL_PER_TYPE)
+        
         print("[SPAWNER] Initialized")
     
-    def update(self, current_speed):
+    def prefill_pools(self, count):
+        """
+        Build entities up front so early spawns recycle instead of constructing.
+        
+        Args:
+            count (int): Entities to build per obstacle and collectible type
+        """
+        z = config.OBSTACLE_SPAWN_DISTANCE
+        
+        # Spawn them all before releasing any, so each spawn builds a new entity
+        warm = [
+            Obstacle.spawn(self.obstacle_pool, 0, z, obs_type)
+            for obs_type in config.OBSTACLE_TYPES
+            for _ in range(count)
+        ]
+        warm += [
+            Collectible.spawn(self.collectible_pool, 0, z, item_type)
+            for item_type in config.COLLECTIBLE_TYPES
+            for _ in range(count)
+        ]
+        
+        for entity in warm:
+            entity.cleanup()  # Disable and park in its pool
+    
+    def update(self, current_speed, dt):
         """
         Update spawner each frame.
         
         Args:
             current_speed (float): Current track scroll speed
+            dt (float): Frame delta time in seconds
         """
-        self.spawn_timer -= time.dt
+        self.spawn_timer -= dt
         
         if self.spawn_timer <= 0:
             self.spawn_obstacle()
             
             # Chance to spawn collectible
-            if random.random() < config.COLLECTIBLE_SPAWN_CHANCE:  # 30% chance
+            if random.random() < _COLLECTIBLE_SPAWN_CHANCE:  # 30% chance
                 self.spawn_collectible()
             
             # Calculate next spawn interval (scales with difficulty)
-            base_interval = random.uniform(
-                config.SPAWN_INTERVAL_MIN,
-                config.SPAWN_INTERVAL_MAX
-            )
+            base_interval = random.uniform(_SPAWN_INTERVAL_MIN, _SPAWN_INTERVAL_MAX)
             
             # Use difficulty manager if available
             if self.difficulty_manager:
@@ -58,18 +98,15 @@ class ObstacleSpawner:
         Create a new obstacle at spawn distance.
         """
         # Choose random type
-        obs_type = random.choice(['low', 'high', 'moving'])
+        obs_type = random.choice(_OBSTACLE_TYPES)
         
         # Choose lane (avoid same lane as last time)
-        valid_lanes = [0, 1, 2]
-        if self.last_lane in valid_lanes:
-            valid_lanes.remove(self.last_lane)
-        lane = random.choice(valid_lanes)
+        lane = random.choice(_OTHER_LANES[self.last_lane])
         self.last_lane = lane
         
         # Create obstacle
-        obs = Obstacle(lane, config.OBSTACLE_SPAWN_DISTANCE, obs_type)
-        self.obstacles.append(obs)
+        obs = Obstacle.spawn(self.obstacle_pool, lane, _SPAWN_Z, obs_type)
+        self.scroll_system.add_obstacle(obs)
         
         return obs
     
@@ -85,33 +122,22 @@ class ObstacleSpawner:
         # Choose lane (try to put it in a different lane than the obstacle if possible)
         # For simplicity, just random lane for now, or maybe the same lane as obstacle if it's jumpable?
         # Let's pick a random lane that ISN'T the last obstacle lane to encourage movement
-        valid_lanes = [0, 1, 2]
-        if self.last_lane in valid_lanes:
-            valid_lanes.remove(self.last_lane)
-        lane = random.choice(valid_lanes)
+        lane = random.choice(_OTHER_LANES[self.last_lane])
         
         # Spawn slightly behind the obstacle so it doesn't overlap perfectly?
         # Or just same distance.
         # Let's spawn it at same distance but different lane.
         
-        item = Collectible(lane, config.OBSTACLE_SPAWN_DISTANCE, item_type)
-        self.obstacles.append(item)
+        item = Collectible.spawn(self.collectible_pool, lane, _SPAWN_Z, item_type)
+        self.scroll_system.add_collectible(item)
         
         return item
     
-    def cleanup_obstacles(self):
-        """
-        Remove obstacles that have been destroyed.
-        """
-        # Keep only obstacles that still exist (enabled is Ursina property)
-        self.obstacles = [obs for obs in self.obstacles if obs.enabled]
-    
     def reset(self):
         """
-        Clear all obstacles and reset spawner.
+        Reset spawner timing.
+        Active entities are recycled by ScrollSystem.reset().
         """
-        for obs in self.obstacles:
-            destroy(obs)
-        self.obstacles.clear()
         self.spawn_timer = config.SPAWN_INTERVAL_MAX
-        print("[SPAWNER] Reset")
+        if config.DEBUG_MODE:
+            dlog("[SPAWNER] Reset")
@@ -2,8 +2,44 @@
 HUD System - Heads-Up Display
 """
 
+from dataclasses import dataclass
 from ursina import *
 import config
+from systems.game_state import GameState
+
+@dataclass(slots=True)
+class HUDSnapshot:
+    """
+    Everything the HUD displays, quantized to what is actually shown.
+    
+    Two snapshots compare equal when the HUD would look the same, so an
+    unchanged snapshot means the HUD can skip the frame.
+    """
+    score: int
+    distance: int
+    shield_active: bool
+    shield_tenths: int  # Shield timer in tenths of a second (shown as 0.0s)
+    game_state: GameState
+    orbs_collected: int
+    high_score: int
+
+# Elements shown in each game state, indexed by GameState (extras are added in update)
+_VISIBLE_BY_STATE = (
+    frozenset(('menu_title', 'menu_subtitle', 'menu_instructions')),  # MENU
+    frozenset(('stats_text',)),                                      # PLAYING
+    frozenset(('stats_text', 'pause_text')),                         # PAUSED
+    frozenset(('game_over_text',)),                                  # GAME_OVER
+)
+
+# Label templates, filled from a tuple of the values they show
+_STATS_TEMPLATE = 'Score: {}\nDistance: {}m'
+_BEST_TEMPLATE = 'Best: {}'
+_SHIELD_TEMPLATE = 'SHIELD ACTIVE ({}.{}s)'
+_GAME_OVER_TEMPLATE = (
+    'GAME OVER\n\nFinal Score: {}\nDistance: {}m\n'
+    'Orbs Collected: {}\n\n'
+    'Press R to Restart\nPress ESC to Main Menu'
+)
 
 class HUD:
     """
@@ -11,23 +47,15 @@ class HUD:
     """
     
     def __init__(self):
-        # Score (Top Left)
-        self.score_text = Text(
-            text='Score: 0',
-            position=config.UI_SCORE_POSITION,
+        # Score and distance (Top Left), one Text so the live stats are a single node
+        self.stats_text = Text(
+            text='Score: 0\nDistance: 0m',
+            position=config.UI_STATS_POSITION,
             scale=config.UI_FONT_SIZE,
             color=config.UI_COLOR
         )
         
-        # Distance (Top Right)
-        self.distance_text = Text(
-            text='Distance: 0m',
-            position=config.UI_DISTANCE_POSITION,
-            scale=config.UI_FONT_SIZE,
-            color=config.UI_COLOR
-        )
-        
-        # High Score (Top Right, below distance)
+        # High Score (Top Right)
         self.high_score_text = Text(
             text='Best: 0',
             position=(0.65, 0.40),
@@ -96,52 +124,92 @@ class HUD:
             enabled=False
         )
         
+        # Last snapshot drawn (None forces the first update)
+        self._last_snapshot = None
+        
+        # Values last shown per label, keyed by attribute name.
+        # Assigning .text rebuilds the glyph mesh, so unchanged values are skipped.
+        self._last_value = {}
+        
+        # Names of the elements currently enabled; only the difference is toggled
+        self._visible = frozenset(
+            name for name in (
+                'stats_text', 'high_score_text', 'shield_text',
+                'game_over_text', 'menu_title', 'menu_subtitle', 'menu_instructions',
+                'pause_text'
+            )
+            if getattr(self, name).enabled
+        )
+        
         print("[HUD] Initialized")
     
-    def update(self, score, distance, shield_active, shield_timer, game_state, orbs_collected=0, high_score=0):
+    def update(self, snapshot):
         """
         Update UI elements.
+        Does nothing if the snapshot matches the one drawn last.
+        
+        Args:
+            snapshot (HUDSnapshot): Values to display this frame
         """
-        # Hide everything by default
-        self.score_text.enabled = False
-        self.score_text.enabled = False
-        self.distance_text.enabled = False
-        self.high_score_text.enabled = False
-        self.shield_text.enabled = False
-        self.game_over_text.enabled = False
-        self.menu_title.enabled = False
-        self.menu_subtitle.enabled = False
-        self.menu_instructions.enabled = False
-        self.pause_text.enabled = False
-        
-        if game_state == 'menu':
-            self.menu_title.enabled = True
-            self.menu_subtitle.enabled = True
-            self.menu_instructions.enabled = True
-            
-        elif game_state == 'playing':
-            self.score_text.enabled = True
-            self.distance_text.enabled = True
-            
-            self.score_text.text = f'Score: {int(score)}'
-            self.distance_text.text = f'Distance: {int(distance)}m'
+        if snapshot == self._last_snapshot:
+            return  # Nothing visible changed
+        self._last_snapshot = snapshot
+        
+        game_state = snapshot.game_state
+        playing = game_state == GameState.PLAYING
+        
+        # Visibility per state, plus the play-only extras
+        visible = _VISIBLE_BY_STATE[game_state]
+        if playing:
+            if snapshot.high_score > 0:
+                visible = visible | {'high_score_text'}
+            if snapshot.shield_active:
+                visible = visible | {'shield_text'}
+        self._show_only(visible)
+        
+        if playing:
+            self._set_label('stats_text', _STATS_TEMPLATE, (snapshot.score, snapshot.distance))
             
             # Show high score if it exists
-            if high_score > 0:
-                self.high_score_text.enabled = True
-                self.high_score_text.text = f'Best: {int(high_score)}'
-            
-            if shield_active:
-                self.shield_text.enabled = True
-                self.shield_text.text = f'SHIELD ACTIVE ({shield_timer:.1f}s)'
+            if snapshot.high_score > 0:
+                self._set_label('high_score_text', _BEST_TEMPLATE, (snapshot.high_score,))
             
-        elif game_state == 'paused':
-            self.score_text.enabled = True
-            self.distance_text.enabled = True
-            self.pause_text.enabled = True
+            if snapshot.shield_active:
+                tenths = snapshot.shield_tenths
+                self._set_label('shield_text', _SHIELD_TEMPLATE, divmod(tenths, 10))
             
-        elif game_state == 'game_over':
-            self.score_text.enabled = False
-            self.distance_text.enabled = False
-            self.game_over_text.enabled = True
-            self.game_over_text.text = f'GAME OVER\n\nFinal Score: {int(score)}\nDistance: {int(distance)}m\nOrbs Collected: {orbs_collected}\n\nPress R to Restart\nPress ESC to Main Menu'
+        elif game_state == GameState.GAME_OVER:
+            # Final numbers are fixed once the run ends, so this formats once per run.
+            # Menu and pause text are static and set in __init__.
+            self._set_label('game_over_text', _GAME_OVER_TEMPLATE, (
+                snapshot.score, snapshot.distance, snapshot.orbs_collected
+            ))
+    
+    def _show_only(self, visible):
+        """
+        Enable exactly the given elements, toggling only those whose state changes.
+        
+        Args:
+            visible (frozenset): Attribute names of the elements to show
+        """
+        previous = self._visible
+        if visible == previous:
+            return
+        for name in visible - previous:
+            getattr(self, name).enabled = True
+        for name in previous - visible:
+            getattr(self, name).enabled = False
+        self._visible = visible
+    
+    def _set_label(self, name, template, values):
+        """
+        Show values in a label, formatting and assigning only when they changed.
+        
+        Args:
+            name (str): Attribute name of the Text element
+            template (str): Format string with one {} per value
+            values (tuple): Values to show
+        """
+        if self._last_value.get(name) != values:
+            self._last_value[name] = values
+            getattr(self, name).text = template.format(*values)
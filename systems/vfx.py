@@ -5,6 +5,13 @@ VFX System - Visual Juice
 from ursina import *
 import random
 import config
+from utils.log import dlog
+
+_INV_SHAKE_DECAY = 1.0 / config.SHAKE_DURATION_COLLISION  # Shake decays linearly over this
+_PARTICLE_POOL_SIZE = config.PARTICLE_POOL_SIZE
+_PARTICLE_LIFETIME = config.PARTICLE_LIFETIME
+_INV_PARTICLE_LIFETIME = 1.0 / config.PARTICLE_LIFETIME
+_PARTICLE_SCALE = 0.2
 
 class VFXManager:
     """
@@ -14,32 +21,88 @@ class VFXManager:
     def __init__(self):
         self.shake_timer = 0.0
         self.shake_intensity = 0.0
-        self.shake_offset = Vec3(0, 0, 0)
+        
+        # Camera shake offset this frame (0.0 when not shaking)
+        self.shake_x = 0.0
+        self.shake_y = 0.0
+        
+        # Particle cubes built once and handed out round-robin
+        self._pool = [Entity(model='cube', enabled=False, collider=None)
+                      for _ in range(_PARTICLE_POOL_SIZE)]
+        self._next = 0
+        
+        # Per-slot flight state, parallel to _pool (origin, velocity, age)
+        self._ox = [0.0] * _PARTICLE_POOL_SIZE
+        self._oy = [0.0] * _PARTICLE_POOL_SIZE
+        self._oz = [0.0] * _PARTICLE_POOL_SIZE
+        self._vx = [0.0] * _PARTICLE_POOL_SIZE
+        self._vy = [0.0] * _PARTICLE_POOL_SIZE
+        self._vz = [0.0] * _PARTICLE_POOL_SIZE
+        self._age = [0.0] * _PARTICLE_POOL_SIZE
+        self._live = []  # Slot indices currently in flight
         
         print("[VFX] Initialized")
     
-    def update(self):
+    def update(self, dt):
         """
         Update effects.
+        
+        Args:
+            dt (float): Frame delta time in seconds
         """
         # Update shake
         if self.shake_timer > 0:
-            self.shake_timer -= time.dt
-            
-            # Random offset based on intensity
-            # Decay intensity over time
-            current_intensity = self.shake_intensity * (self.shake_timer / config.SHAKE_DURATION_COLLISION)
-            
-            self.shake_offset = Vec3(
-                random.uniform(-current_intensity, current_intensity),
-                random.uniform(-current_intensity, current_intensity),
-                0
-            )
+            self.shake_timer -= dt
             
             if self.shake_timer <= 0:
-                self.shake_offset = Vec3(0, 0, 0)
-        else:
-            self.shake_offset = Vec3(0, 0, 0)
+                self.shake_x = 0.0
+                self.shake_y = 0.0
+            else:
+                # Random offset in [-intensity, intensity], decaying over time
+                span = 2.0 * self.shake_intensity * self.shake_timer * _INV_SHAKE_DECAY
+                self.shake_x = (random.random() - 0.5) * span
+                self.shake_y = (random.random() - 0.5) * span
+        
+        if self._live:
+            self._update_particles(dt)
+    
+    def _update_particles(self, dt):
+        """
+        Advance every live particle and hide the ones that finished.
+        Position eases out (exponential) toward origin + velocity; scale shrinks linearly.
+        
+        Args:
+            dt (float): Frame delta time in seconds
+        """
+        pool = self._pool
+        ox, oy, oz = self._ox, self._oy, self._oz
+        vx, vy, vz = self._vx, self._vy, self._vz
+        ages = self._age
+        
+        still_live = []
+        for i in self._live:
+            age = ages[i] + dt
+            p = pool[i]
+            if age >= _PARTICLE_LIFETIME:
+                p.enabled = False
+                continue
+            ages[i] = age
+            
+            f = age * _INV_PARTICLE_LIFETIME
+            ease = 1.0 - 2.0 ** (-10.0 * f)  # Same shape as curve.out_expo
+            p.position = (ox[i] + vx[i] * ease, oy[i] + vy[i] * ease, oz[i] + vz[i] * ease)
+            p.scale = _PARTICLE_SCALE * (1.0 - f)
+            still_live.append(i)
+        self._live = still_live
+    
+    def clear_particles(self):
+        """
+        Hide every particle still in flight (used on restart).
+        """
+        pool = self._pool
+        for i in self._live:
+            pool[i].enabled = False
+        self._live = []
             
     def shake_camera(self, intensity, duration):
         """
@@ -47,32 +110,44 @@ class VFXManager:
         """
         self.shake_intensity = intensity
         self.shake_timer = duration
-        print(f"[VFX] Shake triggered: {intensity}")
+        if config.DEBUG_MODE:
+            dlog(f"[VFX] Shake triggered: {intensity}")
         
     def create_particles(self, position, color, count=10):
         """
         Create simple particle explosion.
+        Reuses pooled cubes; the oldest particle is recycled if the pool wraps.
+        Motion is advanced in update(), not by per-particle animations.
+        
+        Args:
+            position (Vec3): World position to burst from
+            color (Color): Particle color
+            count (int): Number of particles
         """
+        pool = self._pool
+        live = self._live
+        uniform = random.uniform
+        x, y, z = position.x, position.y, position.z
+        index = self._next
         for _ in range(count):
-            # Create a small cube that flies out
-            p = Entity(
-                model='cube',
-                color=color,
-                scale=0.2,
-                position=position,
-                collider=None
-            )
+            p = pool[index]
+            if not p.enabled:
+                live.append(index)  # A recycled in-flight slot is already listed
+            
+            self._ox[index] = x
+            self._oy[index] = y
+            self._oz[index] = z
             
             # Give it random velocity
-            velocity = Vec3(
-                random.uniform(-5, 5),
-                random.uniform(5, 10),
-                random.uniform(-5, 5)
-            )
+            self._vx[index] = uniform(-5, 5)
+            self._vy[index] = uniform(5, 10)
+            self._vz[index] = uniform(-5, 5)
+            self._age[index] = 0.0
             
-            # Animate it
-            p.animate_position(p.position + velocity, duration=0.5, curve=curve.out_expo)
-            p.animate_scale(0, duration=0.5, curve=curve.linear)
+            p.color = color
+            p.scale = _PARTICLE_SCALE
+            p.position = (x, y, z)
+            p.enabled = True
             
-            # Destroy after animation
-            destroy(p, delay=0.5)
+            index = (index + 1) % _PARTICLE_POOL_SIZE
+        self._next = index
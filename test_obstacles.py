@@ -40,7 +40,13 @@ obs4 = Obstacle(lane=1, z_position=50, obs_type='low')
 obstacles.append(obs4)
 
 def update():
-    camera_controller.update()
+    dt = time.dt
+    camera_controller.update(player.x, dt)
+    
+    # Moving obstacles shift lanes (ScrollSystem does this in the game)
+    for obs in obstacles:
+        if obs.tick is not None:
+            obs.tick(dt)
 
 def input(key):
     if key == 'escape':
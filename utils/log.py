@@ -0,0 +1,36 @@
+"""
+Debug Log - Buffered Gameplay Logging
+
+Gameplay events (collisions, pickups, state changes) are appended to a
+ring buffer instead of printed on the spot, and written out in one batch
+by flush_log(). Keeps console I/O out of the frame that raised the event.
+"""
+
+import atexit
+from collections import deque
+
+import config
+
+_buffer = deque(maxlen=config.LOG_BUFFER_SIZE)  # Oldest lines drop first if flushing stalls
+
+def dlog(msg):
+    """
+    Queue a log line for the next flush.
+    Callers gate on config.DEBUG_MODE so the message isn't even formatted otherwise.
+
+    Args:
+        msg (str): Line to log, with its [TAG] prefix
+    """
+    _buffer.append(msg)
+
+def flush_log():
+    """
+    Print every queued line, oldest first.
+    """
+    if not _buffer:
+        return
+    lines = list(_buffer)
+    _buffer.clear()
+    print('\n'.join(lines))
+
+atexit.register(flush_log)  # Don't lose the last lines on quit
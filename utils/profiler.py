@@ -0,0 +1,83 @@
+"""
+Frame Profiler - Per-Section Timing
+
+Accumulates wall time per named section of the game loop and reports
+mean and standard deviation in microseconds. Only used when
+config.PROFILE is on; callers gate every call, so it costs a single
+branch per section otherwise.
+"""
+
+import math
+from time import perf_counter
+
+import config
+
+class FrameProfiler:
+    """
+    Running timing totals for named sections of the frame.
+    """
+
+    __slots__ = ('order', 'sums', 'sq_sums', 'counts', 'frames')
+
+    def __init__(self, order=()):
+        """
+        Create an empty profiler.
+
+        Args:
+            order (tuple): Section names in report order; others follow as first seen
+        """
+        self.order = order
+        self.sums = {}
+        self.sq_sums = {}
+        self.counts = {}
+        self.frames = 0
+
+    def lap(self, name, start):
+        """
+        Record the time since start against a section.
+
+        Args:
+            name (str): Section name
+            start (float): perf_counter() value when the section began
+
+        Returns:
+            float: perf_counter() now, to start the next section from
+        """
+        now = perf_counter()
+        elapsed = now - start
+        if name in self.sums:
+            self.sums[name] += elapsed
+            self.sq_sums[name] += elapsed * elapsed
+            self.counts[name] += 1
+        else:
+            self.sums[name] = elapsed
+            self.sq_sums[name] = elapsed * elapsed
+            self.counts[name] = 1
+        return now
+
+    def end_frame(self):
+        """
+        Count a finished frame and report every PROFILE_REPORT_FRAMES frames.
+        """
+        self.frames += 1
+        if self.frames >= config.PROFILE_REPORT_FRAMES:
+            self.dump()
+
+    def dump(self):
+        """
+        Print mean and standard deviation per section, then start over.
+        """
+        if not self.counts:
+            return
+        print(f"[PROFILE] {self.frames} frames")
+        names = [name for name in self.order if name in self.counts]
+        names += [name for name in self.counts if name not in self.order]
+        for name in names:
+            count = self.counts[name]
+            mean = self.sums[name] / count
+            variance = max(self.sq_sums[name] / count - mean * mean, 0.0)
+            print(f"[PROFILE] {name:<10} {mean * 1e6:8.1f} ± {math.sqrt(variance) * 1e6:.1f} µs")
+        self.sums.clear()
+        self.sq_sums.clear()
+        self.counts.clear()
+        self.frames = 0
@@ -4,9 +4,11 @@ Generates simple textures for the game assets to avoid API rate limits.
 """
 
 from PIL import Image, ImageDraw
+from multiprocessing import Pool
+import numpy as np
 import random
-import math
 import os
+import sys
 
 ASSETS_DIR = 'assets'
 
@@ -14,8 +16,25 @@ def ensure_assets_dir():
     if not os.path.exists(ASSETS_DIR):
         os.makedirs(ASSETS_DIR)
 
-def generate_track_texture():
+def is_texture_fresh(filename):
+    """
+    Check whether a generated texture can be reused.
+    
+    Args:
+        filename (str): Texture file name inside ASSETS_DIR
+    
+    Returns:
+        bool: True if the file exists and is newer than this generator script
+    """
+    path = os.path.join(ASSETS_DIR, filename)
+    return os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(__file__)
+
+def generate_track_texture(force=False):
     """Generate a stone paved path texture."""
+    if not force and is_texture_fresh('track_texture.png'):
+        print("Skipped track_texture.png (up to date)")
+        return
+    
     size = 512
     img = Image.new('RGB', (size, size), (100, 100, 100))
     draw = ImageDraw.Draw(img)
@@ -42,122 +61,127 @@ def generate_track_texture():
     img.save(os.path.join(ASSETS_DIR, 'track_texture.png'))
     print("Generated track_texture.png")
 
-def generate_wall_texture():
+def generate_wall_texture(force=False):
     """Generate a mossy stone wall texture."""
+    if not force and is_texture_fresh('wall_texture.png'):
+        print("Skipped wall_texture.png (up to date)")
+        return
+    
     size = 256
-    img = Image.new('RGB', (size, size), (80, 80, 80))
-    pixels = img.load()
-    
-    for x in range(size):
-        for y in range(size):
-            # Noise
-            noise = random.randint(-20, 20)
-            r = max(0, min(255, 80 + noise))
-            g = max(0, min(255, 80 + noise))
-            b = max(0, min(255, 80 + noise))
-            
-            # Moss
-            if random.random() < 0.1:
-                g = max(0, min(255, g + 50))
-                
-            pixels[x, y] = (r, g, b)
-            
-    img.save(os.path.join(ASSETS_DIR, 'wall_texture.png'))
+    rng = np.random.default_rng()  # Own generator: forked pool workers would share np.random state
+    
+    # Noise (one grey value per pixel)
+    noise = rng.integers(-20, 21, (size, size), dtype=np.int16)
+    grey = np.clip(80 + noise, 0, 255)
+    
+    # Moss: ~10% of pixels get a green boost
+    moss = rng.random((size, size)) < 0.1
+    green = np.where(moss, np.clip(grey + 50, 0, 255), grey)
+    
+    pixels = np.dstack([grey, green, grey]).astype(np.uint8)
+    Image.fromarray(pixels, 'RGB').save(os.path.join(ASSETS_DIR, 'wall_texture.png'))
     print("Generated wall_texture.png")
 
-def generate_wood_texture():
+def generate_wood_texture(force=False):
     """Generate a wood grain texture."""
+    if not force and is_texture_fresh('wood_texture.png'):
+        print("Skipped wood_texture.png (up to date)")
+        return
+    
     size = 256
-    img = Image.new('RGB', (size, size), (139, 69, 19))
-    pixels = img.load()
-    
-    for x in range(size):
-        for y in range(size):
-            # Wood grain noise
-            grain = math.sin(x * 0.1 + y * 0.02) * 20
-            noise = random.randint(-10, 10)
-            
-            r = max(0, min(255, 139 + int(grain) + noise))
-            g = max(0, min(255, 69 + int(grain) + noise))
-            b = max(0, min(255, 19 + int(grain) + noise))
-            
-            pixels[x, y] = (r, g, b)
-            
-    img.save(os.path.join(ASSETS_DIR, 'wood_texture.png'))
+    rng = np.random.default_rng()
+    
+    # Pixel coordinates, indexed [y, x] like the image rows
+    ys, xs = np.mgrid[0:size, 0:size]
+    
+    # Wood grain (truncated like int()) plus per-pixel noise
+    grain = (np.sin(xs * 0.1 + ys * 0.02) * 20).astype(np.int16)
+    noise = rng.integers(-10, 11, (size, size), dtype=np.int16)
+    shift = (grain + noise)[:, :, np.newaxis]
+    
+    base = np.array([139, 69, 19], dtype=np.int16)
+    pixels = np.clip(base + shift, 0, 255).astype(np.uint8)
+    Image.fromarray(pixels, 'RGB').save(os.path.join(ASSETS_DIR, 'wood_texture.png'))
     print("Generated wood_texture.png")
 
-def generate_metal_texture():
+def generate_metal_texture(force=False):
     """Generate a rusted metal texture."""
+    if not force and is_texture_fresh('metal_texture.png'):
+        print("Skipped metal_texture.png (up to date)")
+        return
+    
     size = 256
-    img = Image.new('RGB', (size, size), (100, 100, 110))
-    pixels = img.load()
+    rng = np.random.default_rng()
+    noise = rng.integers(-30, 31, (size, size, 1), dtype=np.int16)
     
-    for x in range(size):
-        for y in range(size):
-            noise = random.randint(-30, 30)
-            
-            # Rust spots
-            if random.random() < 0.05:
-                r = 150 + noise
-                g = 50 + noise
-                b = 50 + noise
-            else:
-                r = 100 + noise
-                g = 100 + noise
-                b = 110 + noise
-                
-            pixels[x, y] = (max(0, min(255, r)), max(0, min(255, g)), max(0, min(255, b)))
-            
-    img.save(os.path.join(ASSETS_DIR, 'metal_texture.png'))
+    # Rust spots: ~5% of pixels use the rust base color instead of steel
+    rust = rng.random((size, size, 1)) < 0.05
+    base = np.where(
+        rust,
+        np.array([150, 50, 50], dtype=np.int16),
+        np.array([100, 100, 110], dtype=np.int16)
+    )
+    
+    pixels = np.clip(base + noise, 0, 255).astype(np.uint8)
+    Image.fromarray(pixels, 'RGB').save(os.path.join(ASSETS_DIR, 'metal_texture.png'))
     print("Generated metal_texture.png")
 
-def generate_orb_texture():
+def generate_orb_texture(force=False):
     """Generate a glowing orb texture."""
+    if not force and is_texture_fresh('orb_texture.png'):
+        print("Skipped orb_texture.png (up to date)")
+        return
+    
     size = 128
-    img = Image.new('RGB', (size, size), (0, 0, 0))
-    pixels = img.load()
     
     center = size // 2
     max_dist = size // 2
     
-    for x in range(size):
-        for y in range(size):
-            dx = x - center
-            dy = y - center
-            dist = math.sqrt(dx*dx + dy*dy)
-            
-            if dist < max_dist:
-                # Radial gradient
-                intensity = 1.0 - (dist / max_dist)
-                r = int(255 * intensity)
-                g = int(215 * intensity) # Gold
-                b = int(0 * intensity)
-                pixels[x, y] = (r, g, b)
-            else:
-                pixels[x, y] = (0, 0, 0)
-                
-    img.save(os.path.join(ASSETS_DIR, 'orb_texture.png'))
+    # Radial gradient: 1 at the center, 0 at max_dist and beyond
+    ys, xs = np.ogrid[0:size, 0:size]
+    dist = np.hypot(xs - center, ys - center)
+    intensity = np.clip(1.0 - dist / max_dist, 0.0, 1.0)[:, :, np.newaxis]
+    
+    gold = np.array([255, 215, 0], dtype=np.float64)
+    pixels = (gold * intensity).astype(np.uint8)  # Truncates like int()
+    Image.fromarray(pixels, 'RGB').save(os.path.join(ASSETS_DIR, 'orb_texture.png'))
     print("Generated orb_texture.png")
 
-def generate_sky_texture():
+def generate_grid_texture(force=False):
+    """Generate a single grid line tile (tiled along the track)."""
+    if not force and is_texture_fresh('grid_texture.png'):
+        print("Skipped grid_texture.png (up to date)")
+        return
+    
+    # One tile spans GRID_SPACING (5 units); 50px tall makes each row 0.1 units
+    width, height = 4, 50
+    img = Image.new('RGBA', (width, height), (255, 255, 255, 0))
+    draw = ImageDraw.Draw(img)
+    
+    # Opaque white line on the first row; tinted by COLOR_GRID_LINES in-game
+    draw.line([(0, 0), (width - 1, 0)], fill=(255, 255, 255, 255))
+    
+    img.save(os.path.join(ASSETS_DIR, 'grid_texture.png'))
+    print("Generated grid_texture.png")
+
+def generate_sky_texture(force=False):
     """Generate a starry sky texture."""
+    if not force and is_texture_fresh('sky_texture.png'):
+        print("Skipped sky_texture.png (up to date)")
+        return
+    
     size = 1024
-    img = Image.new('RGB', (size, size), (5, 5, 20)) # Dark blue-ish space
-    pixels = img.load()
-    draw = ImageDraw.Draw(img)
+    rng = np.random.default_rng()
     
     # 1. Subtle Nebula/Gradient
-    # Simple vertical gradient/noise
-    for y in range(size):
-        for x in range(size):
-            # Base color
-            r, g, b = 5, 5, 20
-            
-            # Add some noise/nebula clouds
-            noise = random.randint(-5, 5)
-            
-            pixels[x, y] = (max(0, r+noise), max(0, g+noise), max(0, b+noise))
-            
+    # Dark blue-ish space base plus one noise value per pixel (shared by all channels),
+    # built as a single buffer instead of writing pixel by pixel
+    noise = rng.integers(-5, 6, (size, size, 1), dtype=np.int16)
+    base = np.array([5, 5, 20], dtype=np.int16)
+    pixels = np.clip(base + noise, 0, 255).astype(np.uint8)
+    img = Image.fromarray(pixels, 'RGB')
+    draw = ImageDraw.Draw(img)
+    
     # 2. Stars
     num_stars = 500
     for _ in range(num_stars):
@@ -178,11 +202,31 @@ def generate_sky_texture():
     img.save(os.path.join(ASSETS_DIR, 'sky_texture.png'))
     print("Generated sky_texture.png")
 
+def _run_generator(generator, force):
+    """
+    Call one generator in a worker process (top-level so it can be pickled).
+    
+    Args:
+        generator (callable): One of the generate_*_texture functions
+        force (bool): Regenerate even if the texture is up to date
+    """
+    generator(force)
+
 if __name__ == '__main__':
+    # --force regenerates every texture even if it is up to date
+    force = '--force' in sys.argv[1:]
+    
     ensure_assets_dir()
-    generate_track_texture()
-    generate_wall_texture()
-    generate_wood_texture()
-    generate_metal_texture()
-    generate_orb_texture()
-    generate_sky_texture()
+    
+    # The generators share no state, so run them side by side
+    generators = (
+        generate_track_texture,
+        generate_wall_texture,
+        generate_wood_texture,
+        generate_metal_texture,
+        generate_orb_texture,
+        generate_grid_texture,
+        generate_sky_texture,
+    )
+    with Pool(min(len(generators), os.cpu_count() or 1)) as pool:
+        pool.starmap(_run_generator, [(generator, force) for generator in generators])